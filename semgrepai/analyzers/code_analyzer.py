@@ -1,16 +1,25 @@
 from typing import Dict, List, Optional, Set
 from pathlib import Path
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from rich.console import Console
+import os
 import re
 import signal
 import threading
 from concurrent.futures import ThreadPoolExecutor, TimeoutError
 import time
 import ast
+import bisect
+import itertools
 from typing import Any, Union
 
+try:
+    from re import _parser as _sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse as _sre_parse
+
 logger = logging.getLogger(__name__)
 console = Console()
 
@@ -26,7 +35,7 @@ def handle_interrupt(signum, frame):
 signal.signal(signal.SIGINT, handle_interrupt)
 signal.signal(signal.SIGTERM, handle_interrupt)
 
-@dataclass
+@dataclass(slots=True)
 class CodeContext:
     """Represents the context of code being analyzed."""
     file_path: Path
@@ -34,28 +43,16 @@ class CodeContext:
     line_number: int
     function_name: Optional[str] = None
     class_name: Optional[str] = None
-    references: Optional[List[Dict]] = None
-    imports: Optional[List[str]] = None
-    user_input_sources: Optional[List[Dict]] = None
-    dangerous_sinks: Optional[List[Dict]] = None
-    sanitization_functions: Optional[List[Dict]] = None
-    variables: Optional[Dict[str, Any]] = None
-    functions: Optional[Dict[str, Dict]] = None
-    classes: Optional[Dict[str, Dict]] = None
-    dataflow: Optional[List[Dict]] = None
-    
-    def __post_init__(self):
-        """Initialize empty collections if None."""
-        self.references = self.references or []
-        self.imports = self.imports or []
-        self.user_input_sources = self.user_input_sources or []
-        self.dangerous_sinks = self.dangerous_sinks or []
-        self.sanitization_functions = self.sanitization_functions or []
-        self.variables = self.variables or {}
-        self.functions = self.functions or {}
-        self.classes = self.classes or {}
-        self.dataflow = self.dataflow or []
-        
+    references: List[Dict] = field(default_factory=list)
+    imports: List[str] = field(default_factory=list)
+    user_input_sources: List[Dict] = field(default_factory=list)
+    dangerous_sinks: List[Dict] = field(default_factory=list)
+    sanitization_functions: List[Dict] = field(default_factory=list)
+    variables: Dict[str, Any] = field(default_factory=dict)
+    functions: Dict[str, Dict] = field(default_factory=dict)
+    classes: Dict[str, Dict] = field(default_factory=dict)
+    dataflow: List[Dict] = field(default_factory=list)
+
     def add_dataflow(self, flow_type: str, description: str, line: int, **details):
         """Add a dataflow entry with consistent formatting."""
         flow = {
@@ -66,12 +63,129 @@ class CodeContext:
         }
         self.dataflow.append(flow)
 
+def _read_source(file_path: Path) -> str:
+    """Read and decode a source file in one pass.
+
+    Reads the raw bytes with os.read after hinting sequential access to the
+    kernel, decodes once, and applies the universal-newline translation that
+    Path.read_text() would.
+    """
+    fd = os.open(file_path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        chunks = []
+        while True:
+            chunk = os.read(fd, 1 << 20)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    
+    text = b''.join(chunks).decode('utf-8', 'replace')
+    if '\r' in text:
+        text = text.replace('\r\n', '\n').replace('\r', '\n')
+    return text
+
+@dataclass
+class _FileEntry:
+    """Cached content of a source file plus the indexes derived from it."""
+    mtime_ns: int
+    content: str
+
+    @cached_property
+    def _segments(self) -> List[str]:
+        """Content split on '\\n', shared by lines and offsets."""
+        return self.content.split('\n')
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Source lines, split on newlines only so they line up with offsets."""
+        segments = self._segments
+        return segments[:-1] if segments[-1] == '' else segments
+
+    @cached_property
+    def offsets(self) -> List[int]:
+        """Sorted offsets of every newline character in the content."""
+        # Each newline sits one past the end of the segment before it, so a
+        # running sum of (segment length + 1) starting at -1 yields them all.
+        offsets = list(itertools.accumulate(map((1).__add__, map(len, self._segments)), initial=-1))
+        del offsets[0]
+        offsets.pop()
+        return offsets
+
+    @cached_property
+    def tree(self) -> Optional[ast.Module]:
+        """Parsed module, or None if the content is not valid Python."""
+        try:
+            return ast.parse(self.content)
+        except (SyntaxError, ValueError):
+            return None
+
+class _ContentVisitor(ast.NodeVisitor):
+    """Single-pass AST visitor that feeds every node type CodeAnalyzer tracks."""
+
+    def __init__(self, analyzer: 'CodeAnalyzer', context: CodeContext):
+        self.analyzer = analyzer
+        self.context = context
+        self._func_stack: List[Dict] = []
+        self._name_stack: List[Set[str]] = []
+
+    def visit_Import(self, node: ast.Import):
+        self.analyzer._analyze_import(self.context, node)
+
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        self.analyzer._analyze_import_from(self.context, node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self._func_stack.append(self.analyzer._analyze_function(self.context, node))
+        self.generic_visit(node)
+        self._func_stack.pop()
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.analyzer._analyze_class(self.context, node)
+        self.generic_visit(node)
+
+    def visit_Return(self, node: ast.Return):
+        if self._func_stack and node.value:
+            self._func_stack[-1]['returns'].append(self.analyzer._unparse(node.value))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        if self._func_stack:
+            if isinstance(node.func, ast.Name):
+                self._func_stack[-1]['calls'].append(node.func.id)
+            elif isinstance(node.func, ast.Attribute):
+                self._func_stack[-1]['calls'].append(self.analyzer._unparse(node.func))
+        self.analyzer._analyze_call_dataflow(self.context, node)
+        self.generic_visit(node)
+
+    def visit_Assign(self, node: ast.Assign):
+        # Collect the names read by the value while visiting it, so the
+        # dependency analysis below does not need a second walk.
+        names: Set[str] = set()
+        self._name_stack.append(names)
+        self.visit(node.value)
+        self._name_stack.pop()
+        for target in node.targets:
+            self.visit(target)
+        self.analyzer._analyze_assignment(self.context, node, names)
+        self.analyzer._analyze_dataflow(self.context, node, names)
+
+    def visit_Name(self, node: ast.Name):
+        if self._name_stack:
+            self._name_stack[-1].add(node.id)
+
+
 class CodeAnalyzer:
     """Analyzes code for security vulnerabilities with deep context understanding."""
     
     def __init__(self, project_root: Path):
         self.project_root = project_root
-        self.file_cache = {}
+        self.file_cache: Dict[Path, _FileEntry] = {}
+        self._py_files: Optional[List[Path]] = None
+        self._import_index: Optional[Dict[str, Path]] = None
         self.import_graph = {}
         self.class_definitions = {}
         self.function_definitions = {}
@@ -139,6 +253,101 @@ class CodeAnalyzer:
             ]
         }
 
+        # Precompiled forms of the pattern tables above: one alternation per
+        # language and category so a single regex pass classifies every hit.
+        self._user_input_res = self._compile_union(self.user_input_patterns)
+        self._dangerous_sink_res = self._compile_union(self.dangerous_sink_patterns)
+        self._sanitization_res = self._compile_union(self.sanitization_patterns)
+        self._url_res = self._compile_union({
+            lang: [pattern for pattern, _ in patterns]
+            for lang, patterns in self.url_patterns.items()
+        })
+
+        # Every category's patterns per language, with the literal text each
+        # one requires. Files are only scanned for patterns whose literal they
+        # contain, using a zero-width union regex cached per pattern subset.
+        self._security_patterns = {
+            lang: [
+                p
+                for table in (self.user_input_patterns, self.dangerous_sink_patterns,
+                              self.sanitization_patterns)
+                for p in table[lang]
+            ]
+            for lang in self.user_input_patterns
+        }
+        self._security_literals = {
+            lang: [self._required_literal(p) for p in patterns]
+            for lang, patterns in self._security_patterns.items()
+        }
+        self._security_scan_res: Dict[tuple, re.Pattern] = {}
+
+    @staticmethod
+    def _required_literal(pattern: str) -> str:
+        """Return the longest literal run every match of pattern must contain."""
+        parsed = _sre_parse.parse(pattern)
+        if parsed.state.flags & re.IGNORECASE:
+            return ''
+        best = run = ''
+        for op, arg in parsed:
+            if op is _sre_parse.LITERAL:
+                run += chr(arg)
+            else:
+                best = max(best, run, key=len)
+                run = ''
+        return max(best, run, key=len)
+
+    def _security_scan_re(self, language: str, content: str) -> Optional[re.Pattern]:
+        """Return a scan regex for the patterns that can possibly match content."""
+        present = tuple(
+            i for i, literal in enumerate(self._security_literals[language])
+            if literal in content
+        )
+        if not present:
+            return None
+        key = (language, present)
+        regex = self._security_scan_res.get(key)
+        if regex is None:
+            patterns = self._security_patterns[language]
+            regex = re.compile('(?=%s)' % '|'.join(f'(?:{patterns[i]})' for i in present))
+            self._security_scan_res[key] = regex
+        return regex
+
+    @staticmethod
+    def _compile_union(patterns: Dict[str, List[str]]) -> Dict[str, re.Pattern]:
+        """Compile each language's patterns into a single named-group alternation."""
+        return {
+            lang: re.compile('|'.join(f'(?P<g{i}>{p})' for i, p in enumerate(pats)))
+            for lang, pats in patterns.items()
+        }
+
+    def _get_file(self, file_path: Path) -> _FileEntry:
+        """Return the cached entry for a file, re-reading it if it changed on disk."""
+        key = file_path.resolve()
+        mtime_ns = key.stat().st_mtime_ns
+        entry = self.file_cache.get(key)
+        if entry is None or entry.mtime_ns != mtime_ns:
+            entry = _FileEntry(mtime_ns, _read_source(key))
+            self.file_cache[key] = entry
+        return entry
+
+    @staticmethod
+    def _unparse(node: ast.AST) -> str:
+        """Return ast.unparse(node), memoized on the node itself.
+
+        Trees are cached per file, so the source of a node is shared by every
+        visitor and every later analysis of the same file.
+        """
+        src = getattr(node, '_cached_src', None)
+        if src is None:
+            src = ast.unparse(node)
+            node._cached_src = src
+        return src
+
+    @staticmethod
+    def _matched_pattern(patterns: List, match: re.Match):
+        """Return the pattern table entry that produced a match of a union regex."""
+        return patterns[int(match.lastgroup[1:])]
+
     def analyze_finding(self, finding: Dict, progress=None, task_id=None) -> CodeContext:
         """Analyze a finding with full context."""
         try:
@@ -152,11 +361,8 @@ class CodeAnalyzer:
             self.task_id = task_id
             
             try:
-                # Get file content if not in cache
-                if file_path not in self.file_cache:
-                    self.file_cache[file_path] = file_path.read_text()
-                
-                file_content = self.file_cache[file_path]
+                # Get file content (cached)
+                entry = self._get_file(file_path)
                 
                 # Create initial context
                 context = CodeContext(
@@ -173,7 +379,7 @@ class CodeAnalyzer:
                     raise KeyboardInterrupt("Analysis interrupted by user")
                 
                 # Analyze the file
-                self._analyze_file_content(context, file_content)
+                self._analyze_file_content(context, entry)
                 if self.progress and self.task_id:
                     self.progress.update(self.task_id, advance=20)
                 
@@ -225,9 +431,8 @@ class CodeAnalyzer:
             # Convert line number to 0-based index
             line_idx = line_number - 1
             
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            # Read file content (cached)
+            lines = self._get_file(file_path).lines
             
             if not lines:
                 return "Empty file"
@@ -264,28 +469,15 @@ class CodeAnalyzer:
             context = CodeContext(
                 file_path=file_path,
                 code_snippet="",  # Will be set later
-                line_number=0,    # Will be set later
-                imports=[],
-                user_input_sources=[],
-                dangerous_sinks=[],
-                sanitization_functions=[],
-                variables={},
-                functions={},
-                classes={},
-                dataflow=[],
-                references=[]
+                line_number=0     # Will be set later
             )
 
-            # Read and parse file
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                
-            # Store file content in cache
-            self.file_cache[str(file_path)] = content
+            # Read (cached) and parse file
+            entry = self._get_file(file_path)
+            lines = entry.lines
             
-            try:
-                tree = ast.parse(content)
-            except SyntaxError:
+            tree = entry.tree
+            if tree is None:
                 logger.debug(f"Could not parse {file_path} as Python")
                 return context
                 
@@ -294,9 +486,11 @@ class CodeAnalyzer:
             current_class = []
             
             class ContextVisitor(ast.NodeVisitor):
-                def __init__(self, analyzer, context):
+                def __init__(self, analyzer, context, lines, scan_re):
                     self.analyzer = analyzer
                     self.context = context
+                    self.lines = lines
+                    self.scan_re = scan_re
                     
                 def visit_Import(self, node):
                     for name in node.names:
@@ -333,28 +527,25 @@ class CodeAnalyzer:
                     current_class.pop()
                     
                 def visit_Call(self, node):
-                    # Check for security patterns
-                    code_line = content.splitlines()[node.lineno - 1]
-                    
-                    # Check for user input sources
-                    for pattern in self.analyzer.user_input_patterns['python']:
-                        if re.search(pattern, code_line):
+                    # Check for security patterns, skipping lines that match none
+                    code_line = self.lines[node.lineno - 1]
+                    if self.scan_re is not None and self.scan_re.search(code_line):
+                        # Check for user input sources
+                        if self.analyzer._user_input_res['python'].search(code_line):
                             self.context.user_input_sources.append({
                                 'line': node.lineno,
                                 'content': code_line.strip()
                             })
                     
-                    # Check for dangerous sinks
-                    for pattern in self.analyzer.dangerous_sink_patterns['python']:
-                        if re.search(pattern, code_line):
+                        # Check for dangerous sinks
+                        if self.analyzer._dangerous_sink_res['python'].search(code_line):
                             self.context.dangerous_sinks.append({
                                 'line': node.lineno,
                                 'content': code_line.strip()
                             })
                     
-                    # Check for sanitization functions
-                    for pattern in self.analyzer.sanitization_patterns['python']:
-                        if re.search(pattern, code_line):
+                        # Check for sanitization functions
+                        if self.analyzer._sanitization_res['python'].search(code_line):
                             self.context.sanitization_functions.append({
                                 'line': node.lineno,
                                 'content': code_line.strip()
@@ -362,8 +553,10 @@ class CodeAnalyzer:
                     
                     self.generic_visit(node)
             
-            # Visit the AST
-            visitor = ContextVisitor(self, context)
+            # Visit the AST; files without any security pattern literal skip
+            # the per-call pattern checks entirely
+            scan_re = self._security_scan_re('python', entry.content)
+            visitor = ContextVisitor(self, context, lines, scan_re)
             visitor.visit(tree)
             
             return context
@@ -372,64 +565,20 @@ class CodeAnalyzer:
             logger.error(f"Error analyzing file {file_path}: {e}")
             return None
 
-    def _analyze_file_content(self, context: CodeContext, content: str):
+    def _analyze_file_content(self, context: CodeContext, entry: _FileEntry):
         """Analyze the content of a single file."""
-        try:
-            # Parse Python code
-            tree = ast.parse(content)
-            
-            # Initialize all containers
-            context.imports = []
-            context.variables = {}
-            context.functions = {}
-            context.classes = {}
-            context.dataflow = []
-            context.references = []
-            context.user_input_sources = []
-            context.dangerous_sinks = []
-            context.sanitization_functions = []
-            
-            # Analyze the AST
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    self._analyze_import(context, node)
-                elif isinstance(node, ast.ImportFrom):
-                    self._analyze_import_from(context, node)
-                elif isinstance(node, ast.FunctionDef):
-                    self._analyze_function(context, node)
-                elif isinstance(node, ast.ClassDef):
-                    self._analyze_class(context, node)
-                elif isinstance(node, ast.Assign):
-                    self._analyze_assignment(context, node)
-                    self._analyze_dataflow(context, node)
-                elif isinstance(node, ast.Call):
-                    self._analyze_call_dataflow(context, node)
-                
-        except SyntaxError:
+        # Parsed Python code is cached on the file entry
+        tree = entry.tree
+        if tree is None:
             # Not a Python file or invalid syntax
             logger.debug(f"Could not parse {context.file_path} as Python")
-            # Initialize empty containers for non-Python files
-            context.imports = []
-            context.variables = {}
-            context.functions = {}
-            context.classes = {}
-            context.dataflow = []
-            context.references = []
-            context.user_input_sources = []
-            context.dangerous_sinks = []
-            context.sanitization_functions = []
+            return
+        
+        try:
+            # Analyze the AST in a single traversal
+            _ContentVisitor(self, context).visit(tree)
         except Exception as e:
             logger.error(f"Error analyzing file content: {e}")
-            # Initialize empty containers on error
-            context.imports = []
-            context.variables = {}
-            context.functions = {}
-            context.classes = {}
-            context.dataflow = []
-            context.references = []
-            context.user_input_sources = []
-            context.dangerous_sinks = []
-            context.sanitization_functions = []
 
     def _analyze_import(self, context: CodeContext, node: ast.Import):
         """Analyze an import statement."""
@@ -442,8 +591,11 @@ class CodeAnalyzer:
             for name in node.names:
                 context.imports.append(f"{node.module}.{name.name}")
 
-    def _analyze_function(self, context: CodeContext, node: ast.FunctionDef):
-        """Analyze a function definition."""
+    def _analyze_function(self, context: CodeContext, node: ast.FunctionDef) -> Dict:
+        """Analyze a function definition.
+
+        Return values and calls are filled in by the visitor as it walks the body.
+        """
         func_info = {
             'name': node.name,
             'line': node.lineno,
@@ -452,24 +604,15 @@ class CodeAnalyzer:
             'calls': [],
         }
         
-        # Find return values and function calls
-        for child in ast.walk(node):
-            if isinstance(child, ast.Return) and child.value:
-                func_info['returns'].append(ast.unparse(child.value))
-            elif isinstance(child, ast.Call):
-                if isinstance(child.func, ast.Name):
-                    func_info['calls'].append(child.func.id)
-                elif isinstance(child.func, ast.Attribute):
-                    func_info['calls'].append(ast.unparse(child.func))
-        
         context.functions[node.name] = func_info
+        return func_info
 
     def _analyze_class(self, context: CodeContext, node: ast.ClassDef):
         """Analyze a class definition."""
         class_info = {
             'name': node.name,
             'line': node.lineno,
-            'bases': [ast.unparse(base) for base in node.bases],
+            'bases': [self._unparse(base) for base in node.bases],
             'methods': {},
         }
         
@@ -485,8 +628,8 @@ class CodeAnalyzer:
         
         context.classes[node.name] = class_info
 
-    def _analyze_assignment(self, context: CodeContext, node: ast.Assign):
-        """Analyze a variable assignment."""
+    def _analyze_assignment(self, context: CodeContext, node: ast.Assign, names: Set[str]):
+        """Analyze a variable assignment given the names read by the value."""
         for target in node.targets:
             if isinstance(target, ast.Name):
                 var_info = {
@@ -505,24 +648,21 @@ class CodeAnalyzer:
                     var_info['type'] = type(value).__name__
                 except (ValueError, SyntaxError):
                     # For non-literal values, get the source
-                    var_info['value'] = ast.unparse(node.value)
+                    var_info['value'] = self._unparse(node.value)
                     
                     # Check if value comes from user input
                     if isinstance(node.value, ast.Call):
-                        call_source = ast.unparse(node.value.func)
-                        for pattern in self.user_input_patterns['python']:
-                            if re.search(pattern, call_source):
-                                var_info['tainted'] = True
-                                var_info['source'] = call_source
-                                break
+                        call_source = self._unparse(node.value.func)
+                        if self._user_input_res['python'].search(call_source):
+                            var_info['tainted'] = True
+                            var_info['source'] = call_source
                     
                     # Check if value depends on other variables
-                    for other_var in context.variables:
-                        if other_var in ast.unparse(node.value):
-                            # Inherit taint status from dependent variables
-                            if context.variables[other_var].get('tainted'):
-                                var_info['tainted'] = True
-                                var_info['source'] = context.variables[other_var].get('source')
+                    for other_var in sorted(names & context.variables.keys()):
+                        # Inherit taint status from dependent variables
+                        if context.variables[other_var].get('tainted'):
+                            var_info['tainted'] = True
+                            var_info['source'] = context.variables[other_var].get('source')
                 
                 context.variables[target.id] = var_info
                 
@@ -536,17 +676,11 @@ class CodeAnalyzer:
                         source=var_info['source']
                     )
 
-    def _analyze_dataflow(self, context: CodeContext, node: ast.Assign):
-        """Analyze dataflow for assignments."""
+    def _analyze_dataflow(self, context: CodeContext, node: ast.Assign, deps: Set[str]):
+        """Analyze dataflow for assignments given the names read by the value."""
         try:
             for target in node.targets:
                 if isinstance(target, ast.Name):
-                    # Track variable dependencies
-                    deps = set()
-                    for node in ast.walk(node.value):
-                        if isinstance(node, ast.Name):
-                            deps.add(node.id)
-                    
                     # Add dataflow entry for variable dependencies
                     if deps:
                         context.add_dataflow(
@@ -563,7 +697,7 @@ class CodeAnalyzer:
         """Analyze dataflow for function calls."""
         try:
             # Get function name and arguments
-            func_name = ast.unparse(node.func)
+            func_name = self._unparse(node.func)
             args_repr = []
             
             # Format positional arguments
@@ -573,7 +707,7 @@ class CodeAnalyzer:
                 elif isinstance(arg, ast.Constant):
                     args_repr.append(f"constant {str(arg.value)}")
                 else:
-                    args_repr.append(ast.unparse(arg))
+                    args_repr.append(self._unparse(arg))
             
             # Format keyword arguments
             for kw in node.keywords:
@@ -582,7 +716,7 @@ class CodeAnalyzer:
                 elif isinstance(kw.value, ast.Constant):
                     args_repr.append(f"{kw.arg}=constant {str(kw.value.value)}")
                 else:
-                    args_repr.append(f"{kw.arg}={ast.unparse(kw.value)}")
+                    args_repr.append(f"{kw.arg}={self._unparse(kw.value)}")
             
             # Add basic call dataflow
             context.add_dataflow('call', 
@@ -592,26 +726,26 @@ class CodeAnalyzer:
                                arguments=args_repr)
             
             # Check for URL-related operations
-            for pattern, op_type in self.url_patterns['python']:
-                if re.search(pattern, func_name):
-                    # Add URL-specific dataflow information
-                    url_source = None
-                    if node.args:
-                        url_arg = node.args[0]
-                        if isinstance(url_arg, ast.Constant):
-                            url_source = f"hardcoded URL: {url_arg.value}"
-                        elif isinstance(url_arg, ast.Name):
-                            url_source = f"variable: {url_arg.id}"
-                        else:
-                            url_source = f"dynamic expression: {ast.unparse(url_arg)}"
-                    
-                    context.add_dataflow('url_operation',
-                                       f"{op_type} using {url_source}",
-                                       node.lineno,
-                                       operation=op_type,
-                                       url_source=url_source,
-                                       function=func_name)
-                    break
+            url_match = self._url_res['python'].search(func_name)
+            if url_match:
+                _, op_type = self._matched_pattern(self.url_patterns['python'], url_match)
+                # Add URL-specific dataflow information
+                url_source = None
+                if node.args:
+                    url_arg = node.args[0]
+                    if isinstance(url_arg, ast.Constant):
+                        url_source = f"hardcoded URL: {url_arg.value}"
+                    elif isinstance(url_arg, ast.Name):
+                        url_source = f"variable: {url_arg.id}"
+                    else:
+                        url_source = f"dynamic expression: {self._unparse(url_arg)}"
+                
+                context.add_dataflow('url_operation',
+                                   f"{op_type} using {url_source}",
+                                   node.lineno,
+                                   operation=op_type,
+                                   url_source=url_source,
+                                   function=func_name)
             
         except Exception as e:
             logger.debug(f"Error analyzing dataflow for function call: {e}")
@@ -629,65 +763,117 @@ class CodeAnalyzer:
         
         # Add files with matching class/function names
         if context.class_name or context.function_name:
-            for file_path in self.project_root.rglob('*.py'):
-                if file_path != context.file_path and file_path.is_file():
+            for file_path in self._all_py_files():
+                if file_path != context.file_path:
                     related_files.add(file_path)
         
         return related_files
 
+    def _walk_sources(self, root: Path):
+        """Yield Python source files (.py/.pyi) under root.
+
+        Uses os.scandir so file/directory checks come from the cached directory
+        entries, and skips hidden directories (virtualenvs, VCS metadata) and
+        __pycache__.
+        """
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.name.startswith('.') or entry.name == '__pycache__':
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(('.py', '.pyi')) and entry.is_file():
+                            yield Path(entry.path)
+            except OSError as e:
+                logger.debug(f"Could not scan directory: {e}")
+
+    def _build_source_index(self):
+        """Index the project's Python sources once per analyzer."""
+        py_files = []
+        import_index = {}
+        for file_path in self._walk_sources(self.project_root):
+            import_index[file_path.relative_to(self.project_root).as_posix()] = file_path
+            if file_path.suffix == '.py':
+                py_files.append(file_path)
+        self._py_files = py_files
+        self._import_index = import_index
+
+    def _all_py_files(self) -> List[Path]:
+        """Return every Python file under the project root."""
+        if self._py_files is None:
+            self._build_source_index()
+        return self._py_files
+
     def _find_import_file(self, import_name: str) -> Optional[Path]:
         """Find the file corresponding to an import."""
-        parts = import_name.split('.')
+        if self._import_index is None:
+            self._build_source_index()
+        module_path = '/'.join(import_name.split('.'))
         
-        # Try direct file match
-        for ext in ['.py', '.pyi']:
-            file_path = self.project_root / f"{'/'.join(parts)}{ext}"
-            if file_path.is_file():
+        # Try direct file match, then as package
+        for candidate in (f"{module_path}.py", f"{module_path}.pyi", f"{module_path}/__init__.py"):
+            file_path = self._import_index.get(candidate)
+            if file_path is not None:
                 return file_path
         
-        # Try as package
-        init_path = self.project_root / '/'.join(parts) / '__init__.py'
-        if init_path.is_file():
-            return init_path
-        
         return None
 
     def _analyze_related_files(self, context: CodeContext, related_files: Set[Path]):
         """Analyze files related to the current context."""
         if not related_files:
             return
+        
+        # Submit files in batches to amortize per-task overhead; references are
+        # merged here, in a stable order, rather than from the worker threads.
+        files = sorted(related_files)
+        workers = os.cpu_count() or 4
+        batch_size = max(1, len(files) // (4 * workers))
+        batches = [files[i:i + batch_size] for i in range(0, len(files), batch_size)]
             
-        with ThreadPoolExecutor(max_workers=4) as executor:
+        with ThreadPoolExecutor(max_workers=min(workers, len(batches))) as executor:
             futures = []
             
-            for file_path in related_files:
+            for batch in batches:
                 if shutdown_flag.is_set():
                     break
                     
-                if file_path not in self.file_cache:
-                    try:
-                        future = executor.submit(self._analyze_single_file, file_path, context)
-                        futures.append(future)
-                    except Exception:
-                        continue
+                try:
+                    future = executor.submit(self._analyze_file_batch, batch, context)
+                    futures.append((future, len(batch)))
+                except Exception:
+                    continue
             
             # Wait for all futures to complete or until shutdown
-            for future in futures:
+            for future, batch_len in futures:
                 try:
                     if not shutdown_flag.is_set():
-                        future.result(timeout=5)  # 5 second timeout per file
+                        # 5 second timeout per file
+                        context.references.extend(future.result(timeout=5 * batch_len))
                 except (TimeoutError, Exception) as e:
                     logger.warning(f"Error analyzing related file: {e}")
                     continue
 
-    def _analyze_single_file(self, file_path: Path, context: CodeContext) -> None:
-        """Analyze a single related file."""
+    def _analyze_file_batch(self, file_paths: List[Path], context: CodeContext) -> List[Dict]:
+        """Analyze a batch of related files, returning their combined references."""
+        references = []
+        for file_path in file_paths:
+            if shutdown_flag.is_set():
+                break
+            references.extend(self._analyze_single_file(file_path, context))
+        return references
+
+    def _analyze_single_file(self, file_path: Path, context: CodeContext) -> List[Dict]:
+        """Analyze a single related file and return references to the context."""
+        # Find references to our context
+        references = []
+        
         try:
-            content = file_path.read_text()
-            self.file_cache[str(file_path)] = content
-            
-            # Find references to our context
-            references = []
+            entry = self._get_file(file_path)
+            content = entry.content
+            file_name = str(file_path)
             
             patterns = []
             if context.function_name:
@@ -698,60 +884,71 @@ class CodeAnalyzer:
             for pattern in patterns:
                 if shutdown_flag.is_set():
                     break
-                    
-                for i, line in enumerate(content.splitlines(), 1):
-                    if pattern in line:
-                        references.append({
-                            'file': str(file_path),
-                            'line': i,
-                            'content': line.strip()
-                        })
-            
-            if references:
-                if not context.references:
-                    context.references = []
-                context.references.extend(references)
+                
+                # Search the whole content and map hits to lines; after a hit
+                # resume at the next line, as each line is reported once per pattern.
+                # The line index is only built once a file has a hit.
+                line_no = 0
+                start = content.find(pattern)
+                while start != -1:
+                    offsets = entry.offsets
+                    line_no = bisect.bisect_left(offsets, start, line_no) + 1
+                    references.append({
+                        'file': file_name,
+                        'line': line_no,
+                        'content': entry.lines[line_no-1].strip()
+                    })
+                    if line_no > len(offsets):
+                        break
+                    start = content.find(pattern, offsets[line_no - 1] + 1)
                 
         except Exception as e:
             logger.warning(f"Error analyzing file {file_path}: {e}")
-            return None
+        
+        return references
 
     def _find_security_patterns(self, context: CodeContext):
         """Find security-related patterns in the code."""
-        content = self.file_cache[context.file_path]
+        entry = self._get_file(context.file_path)
+        content = entry.content
         
         # Determine language (simple approach)
         language = 'python' if context.file_path.suffix == '.py' else 'ruby'
         
-        # Find user input sources
-        context.user_input_sources = []
-        for pattern in self.user_input_patterns[language]:
-            for match in re.finditer(pattern, content):
-                line_no = content.count('\n', 0, match.start()) + 1
-                context.user_input_sources.append({
-                    'pattern': pattern,
-                    'line': line_no,
-                    'content': content.splitlines()[line_no-1].strip()
-                })
+        # User input sources, sinks and sanitizers
+        categories = [
+            (self._user_input_res[language], self.user_input_patterns[language]),
+            (self._dangerous_sink_res[language], self.dangerous_sink_patterns[language]),
+            (self._sanitization_res[language], self.sanitization_patterns[language]),
+        ]
+        hits = [[] for _ in categories]
+        next_start = [0] * len(categories)
+        scan_re = self._security_scan_re(language, content)
+        if scan_re is None:
+            # Nothing in the file can match any pattern
+            context.user_input_sources, context.dangerous_sinks, context.sanitization_functions = hits
+            return
+        offsets, lines = entry.offsets, entry.lines
         
-        # Find sinks
-        context.dangerous_sinks = []
-        for pattern in self.dangerous_sink_patterns[language]:
-            for match in re.finditer(pattern, content):
-                line_no = content.count('\n', 0, match.start()) + 1
-                context.dangerous_sinks.append({
-                    'pattern': pattern,
+        # Single pass over the file for candidate offsets; each category then
+        # confirms with an anchored match, skipping offsets inside its last hit
+        # so results are the same as a separate finditer per category.
+        for candidate in scan_re.finditer(content):
+            pos = candidate.start()
+            line_no = None
+            for i, (regex, patterns) in enumerate(categories):
+                if pos < next_start[i]:
+                    continue
+                match = regex.match(content, pos)
+                if not match:
+                    continue
+                next_start[i] = match.end()
+                if line_no is None:
+                    line_no = bisect.bisect_left(offsets, pos) + 1
+                hits[i].append({
+                    'pattern': self._matched_pattern(patterns, match),
                     'line': line_no,
-                    'content': content.splitlines()[line_no-1].strip()
+                    'content': lines[line_no-1].strip()
                 })
         
-        # Find sanitizers
-        context.sanitization_functions = []
-        for pattern in self.sanitization_patterns[language]:
-            for match in re.finditer(pattern, content):
-                line_no = content.count('\n', 0, match.start()) + 1
-                context.sanitization_functions.append({
-                    'pattern': pattern,
-                    'line': line_no,
-                    'content': content.splitlines()[line_no-1].strip()
-                })
+        context.user_input_sources, context.dangerous_sinks, context.sanitization_functions = hits
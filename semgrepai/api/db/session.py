@@ -1,5 +1,7 @@
 """Async SQLAlchemy database session configuration."""
 
+from sqlalchemy import JSON, String, Uuid, event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 from pathlib import Path
@@ -13,6 +15,14 @@ class Base(DeclarativeBase):
     pass
 
 
+# Column type for UUID keys: a native 16-byte uuid on Postgres, 36-char
+# text elsewhere. Values are plain strings either way.
+UUIDType = String(36).with_variant(Uuid(as_uuid=False), "postgresql")
+
+# Column type for JSON documents: binary JSONB on Postgres, JSON elsewhere.
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
 # Create config manager to get database URL
 _config = ConfigManager()
 _db_url = _config.config.api.db_url
@@ -23,13 +33,31 @@ if _db_url.startswith("sqlite"):
     if db_path and db_path != ":memory:":
         Path(db_path).parent.mkdir(parents=True, exist_ok=True)
 
-# Create async engine
+# Create async engine. Filter values are always bound parameters, so each
+# query shape compiles once and is reused from the compiled cache.
 engine = create_async_engine(
     _db_url,
     echo=_config.config.api.debug,
     future=True,
+    query_cache_size=1200,
 )
 
+if _db_url.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_conn, _):
+        """Tune SQLite connections for concurrent reads during scan writes."""
+        cursor = dbapi_conn.cursor()
+        # WAL lets readers proceed while a scan is writing findings; NORMAL
+        # sync is durable under WAL except for the last commit on power loss
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
+        cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+        # SQLite ignores foreign keys (and so ON DELETE CASCADE) unless asked
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -6,10 +6,11 @@ from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 
 from .db import init_db
 from .routes import api_router
+from .services import cancel_running_scans
 from ..config import ConfigManager
 from ..logging import get_logger
 
@@ -26,6 +27,7 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("Shutting down SemgrepAI API server...")
+    await cancel_running_scans()
 
 
 def create_app() -> FastAPI:
@@ -40,6 +42,7 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        default_response_class=ORJSONResponse,
     )
 
     # Configure CORS
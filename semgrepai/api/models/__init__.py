@@ -2,6 +2,7 @@
 
 from ..db.session import Base
 from .scan import Scan, ScanStatus
-from .finding import Finding, TriageStatus
+from .finding import Finding, TriageStatus, VerdictKind, SeverityLevel
 
-__all__ = ["Base", "Scan", "ScanStatus", "Finding", "TriageStatus"]
+__all__ = ["Base", "Scan", "ScanStatus", "Finding", "TriageStatus", "VerdictKind",
+           "SeverityLevel"]
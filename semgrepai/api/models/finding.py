@@ -5,10 +5,12 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional, List, Dict, Any, TYPE_CHECKING
 
-from sqlalchemy import Column, String, Integer, Float, DateTime, Enum, JSON, Text, ForeignKey
+from sqlalchemy import (
+    Column, String, Integer, Float, DateTime, Enum, Text, ForeignKey, Index, DDL, event,
+)
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
-from ..db.session import Base
+from ..db.session import Base, UUIDType, JSONType
 
 if TYPE_CHECKING:
     from .scan import Scan
@@ -23,16 +25,78 @@ class TriageStatus(str, PyEnum):
     FIXED = "fixed"
 
 
+class VerdictKind(str, PyEnum):
+    """Normalized kind of a free-text AI verdict."""
+    TRUE_POSITIVE = "true positive"
+    FALSE_POSITIVE = "false positive"
+    NEEDS_REVIEW = "needs review"
+    ERROR = "error"
+
+    @classmethod
+    def from_verdict(cls, verdict: Optional[str]) -> Optional["VerdictKind"]:
+        """Classify a verdict by the first kind its text mentions, if any."""
+        if verdict:
+            verdict = verdict.lower()
+            for kind in cls:
+                if kind.value in verdict:
+                    return kind
+        return None
+
+
+class SeverityLevel(int, PyEnum):
+    """Normalized level of a finding's severity text."""
+    INFO = 0
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+
+    @classmethod
+    def from_severity(cls, severity: Optional[str]) -> Optional["SeverityLevel"]:
+        """Map a severity name, including Semgrep's ERROR/WARNING, to a level."""
+        return _SEVERITY_LEVELS.get(severity.upper()) if severity else None
+
+
+# Semgrep reports ERROR/WARNING/INFO; those map onto HIGH/MEDIUM/INFO
+_SEVERITY_LEVELS = {
+    **{level.name: level for level in SeverityLevel},
+    "ERROR": SeverityLevel.HIGH,
+    "WARNING": SeverityLevel.MEDIUM,
+}
+
+
 class Finding(Base):
     """Database model for security findings."""
 
     __tablename__ = "findings"
+    __table_args__ = (
+        # Per-scan listings filter on scan_id and sort or filter on these
+        Index("ix_findings_scan_risk", "scan_id", "risk_score"),
+        Index("ix_findings_scan_severity", "scan_id", "severity"),
+        Index("ix_findings_scan_triage", "scan_id", "triage_status"),
+        # get_scan groups a scan's findings by verdict and severity
+        Index("ix_findings_scan_verdict", "scan_id", "verdict", "severity"),
+        # Substring filters (ILIKE '%...%') can use trigram indexes on Postgres
+        *(
+            Index(
+                f"ix_findings_{column}_trgm",
+                column,
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+            ).ddl_if(dialect="postgresql")
+            for column in ("rule_id", "path", "verdict")
+        ),
+        # Containment queries on attack vectors (JSONB @>) on Postgres
+        Index(
+            "ix_findings_attack_vectors", "attack_vectors", postgresql_using="gin"
+        ).ddl_if(dialect="postgresql"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUIDType, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     scan_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("scans.id"), nullable=False, index=True
+        UUIDType, ForeignKey("scans.id", ondelete="CASCADE"), nullable=False, index=True
     )
 
     # Semgrep fields
@@ -51,12 +115,12 @@ class Finding(Base):
     poc: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # JSON fields for complex data
-    attack_vectors: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
-    trigger_steps: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
-    recommended_fixes: Mapped[Optional[List[str]]] = mapped_column(JSON, nullable=True)
-    impact_assessment: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
-    vulnerability_category: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
-    technical_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    attack_vectors: Mapped[Optional[List[str]]] = mapped_column(JSONType, nullable=True)
+    trigger_steps: Mapped[Optional[List[str]]] = mapped_column(JSONType, nullable=True)
+    recommended_fixes: Mapped[Optional[List[str]]] = mapped_column(JSONType, nullable=True)
+    impact_assessment: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONType, nullable=True)
+    vulnerability_category: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONType, nullable=True)
+    technical_details: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONType, nullable=True)
 
     # Triage fields
     triage_status: Mapped[TriageStatus] = mapped_column(
@@ -68,7 +132,7 @@ class Finding(Base):
     assignee: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
     # Metadata from Semgrep
-    semgrep_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
+    semgrep_metadata: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONType, nullable=True)
 
     # Processing info
     processing_time: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -94,12 +158,12 @@ class Finding(Base):
             return "true positive" in self.verdict.lower()
         return None
 
-    @classmethod
-    def from_scan_finding(cls, scan_id: str, finding_dict: Dict[str, Any]) -> "Finding":
-        """Create a Finding from a scan result dictionary."""
+    @staticmethod
+    def _scan_finding_values(scan_id: str, finding_dict: Dict[str, Any]) -> Dict[str, Any]:
+        """Map a scan result dictionary to Finding column values."""
         ai_validation = finding_dict.get("ai_validation", {})
 
-        return cls(
+        return dict(
             scan_id=scan_id,
             # Semgrep fields
             rule_id=finding_dict.get("rule_id", "unknown"),
@@ -124,3 +188,21 @@ class Finding(Base):
             semgrep_metadata=finding_dict.get("metadata"),
             processing_time=finding_dict.get("processing_time"),
         )
+
+    @classmethod
+    def from_scan_finding(cls, scan_id: str, finding_dict: Dict[str, Any]) -> "Finding":
+        """Create a Finding from a scan result dictionary."""
+        return cls(**cls._scan_finding_values(scan_id, finding_dict))
+
+    @classmethod
+    def rows_from_scan(cls, scan_id: str, findings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Build column value rows for a bulk insert of scan result dictionaries."""
+        return [cls._scan_finding_values(scan_id, finding_dict) for finding_dict in findings]
+
+
+# The trigram operator class used by the substring indexes above
+event.listen(
+    Finding.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
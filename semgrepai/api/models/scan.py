@@ -5,10 +5,10 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import Column, String, Integer, DateTime, Enum, JSON, Text
+from sqlalchemy import Column, String, Integer, DateTime, Enum, Text, Index
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 
-from ..db.session import Base
+from ..db.session import Base, UUIDType, JSONType
 
 if TYPE_CHECKING:
     from .finding import Finding
@@ -27,9 +27,15 @@ class Scan(Base):
     """Database model for security scans."""
 
     __tablename__ = "scans"
+    __table_args__ = (
+        # Keyset pagination of list_scans seeks on (created_at, id)
+        Index("ix_scans_created_id", "created_at", "id"),
+        # Status-filtered listings seek and sort within one status
+        Index("ix_scans_status_created_id", "status", "created_at", "id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid.uuid4())
+        UUIDType, primary_key=True, default=lambda: str(uuid.uuid4())
     )
     name: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     target_path: Mapped[str] = mapped_column(String(1024), nullable=False)
@@ -48,7 +54,7 @@ class Scan(Base):
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
     # Store config snapshot at scan time for reproducibility
-    config_snapshot: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    config_snapshot: Mapped[Optional[dict]] = mapped_column(JSONType, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
@@ -58,12 +64,16 @@ class Scan(Base):
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
     )
 
-    # Relationships
+    # Relationships. Findings are not loaded with the scan: listings and
+    # detail views only need the scan row and query findings separately.
+    # Deleting a scan leaves its findings to the database's ON DELETE CASCADE
+    # instead of loading them to delete one by one.
     findings: Mapped[List["Finding"]] = relationship(
         "Finding",
         back_populates="scan",
         cascade="all, delete-orphan",
-        lazy="selectin",
+        passive_deletes=True,
+        lazy="select",
     )
 
     def __repr__(self) -> str:
@@ -5,7 +5,7 @@ from datetime import datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, or_, and_
+from sqlalchemy import select, update, func, or_, and_
 
 from ..db import get_db
 from ..models import Scan, Finding, TriageStatus
@@ -19,6 +19,32 @@ from ..schemas.finding import (
 
 router = APIRouter()
 
+# Columns shown in list views; the code and JSON columns are only loaded
+# for the detail endpoints.
+_LIST_COLUMNS = (
+    Finding.id,
+    Finding.scan_id,
+    Finding.rule_id,
+    Finding.severity,
+    Finding.message,
+    Finding.path,
+    Finding.line,
+    Finding.verdict,
+    Finding.confidence,
+    Finding.risk_score,
+    Finding.triage_status,
+    Finding.assignee,
+    Finding.created_at,
+)
+
+# Triage filter values, unknown ones are ignored
+_TRIAGE_BY_VALUE = {status.value: status for status in TriageStatus}
+
+
+async def _scan_exists(db: AsyncSession, scan_id: str) -> bool:
+    """Check whether a scan exists without loading its row."""
+    return bool(await db.scalar(select(1).where(Scan.id == scan_id)))
+
 
 @router.get("/scans/{scan_id}/findings", response_model=FindingListResponse)
 async def list_findings(
@@ -39,53 +65,49 @@ async def list_findings(
 ):
     """List findings for a scan with filtering and sorting."""
     # Verify scan exists
-    scan_result = await db.execute(select(Scan).where(Scan.id == scan_id))
-    if not scan_result.scalar_one_or_none():
+    if not await _scan_exists(db, scan_id):
         raise HTTPException(status_code=404, detail="Scan not found")
 
-    # Build query
-    query = select(Finding).where(Finding.scan_id == scan_id)
+    # Build filter conditions, shared by the count and the page query
+    conditions = [Finding.scan_id == scan_id]
 
     # Apply filters
     if severity:
         severities = [s.strip().upper() for s in severity.split(",")]
-        query = query.where(Finding.severity.in_(severities))
+        conditions.append(Finding.severity.in_(severities))
 
     if triage_status:
         statuses = [s.strip() for s in triage_status.split(",")]
-        triage_enums = []
-        for s in statuses:
-            try:
-                triage_enums.append(TriageStatus(s))
-            except ValueError:
-                pass
+        triage_enums = [_TRIAGE_BY_VALUE[s] for s in statuses if s in _TRIAGE_BY_VALUE]
         if triage_enums:
-            query = query.where(Finding.triage_status.in_(triage_enums))
+            conditions.append(Finding.triage_status.in_(triage_enums))
 
     if verdict:
         verdicts = [v.strip() for v in verdict.split(",")]
         verdict_conditions = [Finding.verdict.ilike(f"%{v}%") for v in verdicts]
-        query = query.where(or_(*verdict_conditions))
+        conditions.append(or_(*verdict_conditions))
 
     if rule_id:
-        query = query.where(Finding.rule_id.ilike(f"%{rule_id}%"))
+        conditions.append(Finding.rule_id.ilike(f"%{rule_id}%"))
 
     if path_contains:
-        query = query.where(Finding.path.ilike(f"%{path_contains}%"))
+        conditions.append(Finding.path.ilike(f"%{path_contains}%"))
 
     if min_risk_score is not None:
-        query = query.where(Finding.risk_score >= min_risk_score)
+        conditions.append(Finding.risk_score >= min_risk_score)
 
     if max_risk_score is not None:
-        query = query.where(Finding.risk_score <= max_risk_score)
+        conditions.append(Finding.risk_score <= max_risk_score)
 
     if assignee:
-        query = query.where(Finding.assignee == assignee)
+        conditions.append(Finding.assignee == assignee)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
+    # Get total count directly over the filtered table
+    count_query = select(func.count(Finding.id)).where(*conditions)
     total = await db.scalar(count_query)
 
+    query = select(*_LIST_COLUMNS).where(*conditions)
+
     # Apply sorting
     sort_column = getattr(Finding, sort_by, Finding.risk_score)
     if sort_order == "desc":
@@ -97,29 +119,11 @@ async def list_findings(
     query = query.offset((page - 1) * page_size).limit(page_size)
 
     result = await db.execute(query)
-    findings = result.scalars().all()
 
     total_pages = (total + page_size - 1) // page_size
 
     return FindingListResponse(
-        items=[
-            FindingResponse(
-                id=f.id,
-                scan_id=f.scan_id,
-                rule_id=f.rule_id,
-                severity=f.severity,
-                message=f.message,
-                path=f.path,
-                line=f.line,
-                verdict=f.verdict,
-                confidence=f.confidence,
-                risk_score=f.risk_score,
-                triage_status=f.triage_status,
-                assignee=f.assignee,
-                created_at=f.created_at,
-            )
-            for f in findings
-        ],
+        items=[FindingResponse(**row) for row in result.mappings()],
         total=total,
         page=page,
         page_size=page_size,
@@ -144,36 +148,7 @@ async def get_finding(
     if not finding:
         raise HTTPException(status_code=404, detail="Finding not found")
 
-    return FindingDetailResponse(
-        id=finding.id,
-        scan_id=finding.scan_id,
-        rule_id=finding.rule_id,
-        severity=finding.severity,
-        message=finding.message,
-        path=finding.path,
-        line=finding.line,
-        code=finding.code,
-        verdict=finding.verdict,
-        confidence=finding.confidence,
-        risk_score=finding.risk_score,
-        justification=finding.justification,
-        poc=finding.poc,
-        attack_vectors=finding.attack_vectors,
-        trigger_steps=finding.trigger_steps,
-        recommended_fixes=finding.recommended_fixes,
-        impact_assessment=finding.impact_assessment,
-        vulnerability_category=finding.vulnerability_category,
-        technical_details=finding.technical_details,
-        metadata=finding.semgrep_metadata,
-        triage_status=finding.triage_status,
-        triage_note=finding.triage_note,
-        triage_updated_at=finding.triage_updated_at,
-        triage_updated_by=finding.triage_updated_by,
-        assignee=finding.assignee,
-        processing_time=finding.processing_time,
-        created_at=finding.created_at,
-        updated_at=finding.updated_at,
-    )
+    return FindingDetailResponse.model_validate(finding)
 
 
 @router.patch("/scans/{scan_id}/findings/{finding_id}", response_model=FindingDetailResponse)
@@ -205,39 +180,11 @@ async def update_finding(
     if update_data.assignee is not None:
         finding.assignee = update_data.assignee
 
+    # Sessions don't expire on commit and updated_at is set client-side by
+    # onupdate, so the instance is already current without a refresh
     await db.commit()
-    await db.refresh(finding)
-
-    return FindingDetailResponse(
-        id=finding.id,
-        scan_id=finding.scan_id,
-        rule_id=finding.rule_id,
-        severity=finding.severity,
-        message=finding.message,
-        path=finding.path,
-        line=finding.line,
-        code=finding.code,
-        verdict=finding.verdict,
-        confidence=finding.confidence,
-        risk_score=finding.risk_score,
-        justification=finding.justification,
-        poc=finding.poc,
-        attack_vectors=finding.attack_vectors,
-        trigger_steps=finding.trigger_steps,
-        recommended_fixes=finding.recommended_fixes,
-        impact_assessment=finding.impact_assessment,
-        vulnerability_category=finding.vulnerability_category,
-        technical_details=finding.technical_details,
-        metadata=finding.semgrep_metadata,
-        triage_status=finding.triage_status,
-        triage_note=finding.triage_note,
-        triage_updated_at=finding.triage_updated_at,
-        triage_updated_by=finding.triage_updated_by,
-        assignee=finding.assignee,
-        processing_time=finding.processing_time,
-        created_at=finding.created_at,
-        updated_at=finding.updated_at,
-    )
+
+    return FindingDetailResponse.model_validate(finding)
 
 
 @router.post("/scans/{scan_id}/findings/bulk-triage", response_model=dict)
@@ -248,33 +195,33 @@ async def bulk_triage_findings(
 ):
     """Update triage status for multiple findings at once."""
     # Verify scan exists
-    scan_result = await db.execute(select(Scan).where(Scan.id == scan_id))
-    if not scan_result.scalar_one_or_none():
+    if not await _scan_exists(db, scan_id):
         raise HTTPException(status_code=404, detail="Scan not found")
 
-    # Get findings to update
+    # Update all matching findings in a single statement
+    values = {
+        "triage_status": update_data.triage_status,
+        "triage_updated_at": datetime.utcnow(),
+    }
+    if update_data.triage_note:
+        values["triage_note"] = update_data.triage_note
+
     result = await db.execute(
-        select(Finding).where(
+        update(Finding)
+        .where(
             and_(
                 Finding.scan_id == scan_id,
                 Finding.id.in_(update_data.finding_ids),
             )
         )
+        .values(**values)
+        .execution_options(synchronize_session=False)
     )
-    findings = result.scalars().all()
+    updated_count = result.rowcount
 
-    if not findings:
+    if not updated_count:
         raise HTTPException(status_code=404, detail="No findings found with provided IDs")
 
-    # Update all findings
-    updated_count = 0
-    for finding in findings:
-        finding.triage_status = update_data.triage_status
-        finding.triage_updated_at = datetime.utcnow()
-        if update_data.triage_note:
-            finding.triage_note = update_data.triage_note
-        updated_count += 1
-
     await db.commit()
 
     return {
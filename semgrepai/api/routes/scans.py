@@ -1,16 +1,19 @@
 """Scan API routes."""
 
 import asyncio
-from typing import Optional
+import base64
+import binascii
+from typing import Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, tuple_, delete, true
+from sqlalchemy.orm import defer
 
 from ..db import get_db
-from ..models import Scan, ScanStatus, Finding
+from ..models import Scan, ScanStatus, Finding, SeverityLevel, VerdictKind
 from ..schemas.scan import (
     ScanCreate,
     ScanResponse,
@@ -18,15 +21,30 @@ from ..schemas.scan import (
     ScanDetailResponse,
 )
 from ..schemas.common import PaginationParams
-from ..services.scan_service import ScanService
+from ..services.scan_service import start_scan
+from ..services.response_cache import scan_list_cache
 
 router = APIRouter()
 
 
+def _encode_cursor(scan: Scan) -> str:
+    """Encode the sort key of the last scan on a page as an opaque cursor."""
+    key = f"{scan.created_at.isoformat()}|{scan.id}"
+    return base64.urlsafe_b64encode(key.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """Decode a cursor into the (created_at, id) key it was built from."""
+    try:
+        created_at, scan_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(created_at), scan_id
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
+
+
 @router.post("", response_model=ScanResponse, status_code=201)
 async def create_scan(
     scan_data: ScanCreate,
-    background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -35,9 +53,10 @@ async def create_scan(
     The scan runs asynchronously in the background. Use the WebSocket endpoint
     or poll the scan status to track progress.
     """
-    # Validate target path exists
+    # Validate target path exists; stat() runs in a worker thread since it can
+    # block for a long time on network filesystems
     target_path = Path(scan_data.target_path)
-    if not target_path.exists():
+    if not await asyncio.to_thread(target_path.exists):
         raise HTTPException(
             status_code=400,
             detail=f"Target path does not exist: {scan_data.target_path}",
@@ -46,7 +65,7 @@ async def create_scan(
     # Validate rules path if provided
     if scan_data.rules_path:
         rules_path = Path(scan_data.rules_path)
-        if not rules_path.exists():
+        if not await asyncio.to_thread(rules_path.exists):
             raise HTTPException(
                 status_code=400,
                 detail=f"Rules path does not exist: {scan_data.rules_path}",
@@ -60,29 +79,16 @@ async def create_scan(
         status=ScanStatus.PENDING,
     )
 
+    # Defaults are filled in Python on flush and the session keeps attributes
+    # loaded across commit, so the scan needs no refresh before returning
     db.add(scan)
     await db.commit()
-    await db.refresh(scan)
+    scan_list_cache.clear()
 
     # Start scan in background
-    scan_service = ScanService(db)
-    background_tasks.add_task(scan_service.run_scan, scan.id)
-
-    return ScanResponse(
-        id=scan.id,
-        name=scan.name,
-        target_path=scan.target_path,
-        rules_path=scan.rules_path,
-        status=scan.status,
-        started_at=scan.started_at,
-        completed_at=scan.completed_at,
-        total_findings=scan.total_findings,
-        validated_findings=scan.validated_findings,
-        created_at=scan.created_at,
-        updated_at=scan.updated_at,
-        progress_percentage=scan.progress_percentage,
-        duration_seconds=scan.duration_seconds,
-    )
+    start_scan(scan.id)
+
+    return ScanResponse.model_validate(scan)
 
 
 @router.get("", response_model=ScanListResponse)
@@ -90,52 +96,66 @@ async def list_scans(
     page: int = Query(default=1, ge=1),
     page_size: int = Query(default=20, ge=1, le=100),
     status: Optional[ScanStatus] = Query(default=None),
+    cursor: Optional[str] = Query(
+        default=None,
+        description="next_cursor from the previous page; takes precedence over page",
+    ),
+    include_total: bool = Query(
+        default=False,
+        description="Also count all matching scans (fills total and total_pages)",
+    ),
     db: AsyncSession = Depends(get_db),
 ):
     """List all scans with pagination and optional status filter."""
-    # Build query
-    query = select(Scan)
+    # Dashboards poll this endpoint; serve repeats of the same page from a
+    # short-lived cache of the encoded body
+    cache_key = (status, page, page_size, cursor, include_total)
+    cached = scan_list_cache.get(cache_key)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Build query; list items never show the error text or config snapshot
+    query = select(Scan).options(defer(Scan.error_message), defer(Scan.config_snapshot))
 
     if status:
         query = query.where(Scan.status == status)
 
-    # Get total count
-    count_query = select(func.count()).select_from(query.subquery())
-    total = await db.scalar(count_query)
-
-    # Apply pagination and ordering
-    query = query.order_by(Scan.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
-
-    result = await db.execute(query)
+    # Counting every matching scan is only done when the client asks for it
+    total = total_pages = None
+    if include_total:
+        count_query = select(func.count(Scan.id))
+        if status:
+            count_query = count_query.where(Scan.status == status)
+        total = await db.scalar(count_query)
+        total_pages = (total + page_size - 1) // page_size
+
+    # Apply ordering; id breaks ties so the order is total and cursors are stable
+    query = query.order_by(Scan.created_at.desc(), Scan.id.desc())
+
+    # Seek past the cursor instead of skipping rows with OFFSET
+    if cursor:
+        query = query.where(tuple_(Scan.created_at, Scan.id) < _decode_cursor(cursor))
+    else:
+        query = query.offset((page - 1) * page_size)
+
+    # Fetch one extra row to learn whether another page follows
+    result = await db.execute(query.limit(page_size + 1))
     scans = result.scalars().all()
+    has_more = len(scans) > page_size
+    scans = scans[:page_size]
 
-    total_pages = (total + page_size - 1) // page_size
-
-    return ScanListResponse(
-        items=[
-            ScanResponse(
-                id=s.id,
-                name=s.name,
-                target_path=s.target_path,
-                rules_path=s.rules_path,
-                status=s.status,
-                started_at=s.started_at,
-                completed_at=s.completed_at,
-                total_findings=s.total_findings,
-                validated_findings=s.validated_findings,
-                created_at=s.created_at,
-                updated_at=s.updated_at,
-                progress_percentage=s.progress_percentage,
-                duration_seconds=s.duration_seconds,
-            )
-            for s in scans
-        ],
+    response = ScanListResponse(
+        items=[ScanResponse.model_validate(s) for s in scans],
         total=total,
         page=page,
         page_size=page_size,
         total_pages=total_pages,
+        has_more=has_more,
+        next_cursor=_encode_cursor(scans[-1]) if has_more else None,
     )
+    body = response.model_dump_json().encode()
+    scan_list_cache.set(cache_key, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{scan_id}", response_model=ScanDetailResponse)
@@ -144,53 +164,49 @@ async def get_scan(
     db: AsyncSession = Depends(get_db),
 ):
     """Get detailed information about a specific scan."""
-    result = await db.execute(select(Scan).where(Scan.id == scan_id))
-    scan = result.scalar_one_or_none()
+    # Finding statistics: one grouped pass over the scan's findings, joined
+    # onto the scan row so both arrive in a single round trip, and classified
+    # in Python instead of evaluating ILIKE per row and counter
+    breakdown = (
+        select(Finding.verdict, Finding.severity, func.count().label("count"))
+        .where(Finding.scan_id == scan_id)
+        .group_by(Finding.verdict, Finding.severity)
+        .subquery()
+    )
+    result = await db.execute(
+        select(Scan, breakdown.c.verdict, breakdown.c.severity, breakdown.c.count)
+        .outerjoin(breakdown, true())
+        .where(Scan.id == scan_id)
+    )
+    rows = result.all()
 
-    if not scan:
+    if not rows:
         raise HTTPException(status_code=404, detail="Scan not found")
 
-    # Get finding statistics
-    stats_query = select(
-        func.count().filter(Finding.verdict.ilike("%true positive%")).label("true_positives"),
-        func.count().filter(Finding.verdict.ilike("%false positive%")).label("false_positives"),
-        func.count().filter(
-            ~Finding.verdict.ilike("%true positive%")
-            & ~Finding.verdict.ilike("%false positive%")
-        ).label("needs_review"),
-        func.count().filter(Finding.severity.ilike("CRITICAL")).label("severity_critical"),
-        func.count().filter(Finding.severity.ilike("HIGH")).label("severity_high"),
-        func.count().filter(Finding.severity.ilike("MEDIUM")).label("severity_medium"),
-        func.count().filter(Finding.severity.ilike("LOW")).label("severity_low"),
-    ).where(Finding.scan_id == scan_id)
-
-    stats_result = await db.execute(stats_query)
-    stats = stats_result.one()
-
-    return ScanDetailResponse(
-        id=scan.id,
-        name=scan.name,
-        target_path=scan.target_path,
-        rules_path=scan.rules_path,
-        status=scan.status,
-        started_at=scan.started_at,
-        completed_at=scan.completed_at,
-        total_findings=scan.total_findings,
-        validated_findings=scan.validated_findings,
-        created_at=scan.created_at,
-        updated_at=scan.updated_at,
-        progress_percentage=scan.progress_percentage,
-        duration_seconds=scan.duration_seconds,
-        error_message=scan.error_message,
-        config_snapshot=scan.config_snapshot,
-        true_positives=stats.true_positives or 0,
-        false_positives=stats.false_positives or 0,
-        needs_review=stats.needs_review or 0,
-        severity_critical=stats.severity_critical or 0,
-        severity_high=stats.severity_high or 0,
-        severity_medium=stats.severity_medium or 0,
-        severity_low=stats.severity_low or 0,
+    scan = rows[0][0]
+    stats = dict.fromkeys(
+        ("true_positives", "false_positives", "needs_review",
+         "severity_critical", "severity_high", "severity_medium", "severity_low"),
+        0,
     )
+    for _, verdict, severity, count in rows:
+        # A scan without findings comes back as one row with no group
+        if count is None:
+            continue
+        if verdict is not None:
+            kind = VerdictKind.from_verdict(verdict)
+            if kind is VerdictKind.TRUE_POSITIVE:
+                stats["true_positives"] += count
+            elif kind is VerdictKind.FALSE_POSITIVE:
+                stats["false_positives"] += count
+            else:
+                stats["needs_review"] += count
+        # Semgrep's ERROR/WARNING count as high/medium, as on the dashboard
+        level = SeverityLevel.from_severity(severity)
+        if level is not None and level is not SeverityLevel.INFO:
+            stats[f"severity_{level.name.lower()}"] += count
+
+    return ScanDetailResponse.model_validate(scan).model_copy(update=stats)
 
 
 @router.delete("/{scan_id}", status_code=204)
@@ -199,21 +215,26 @@ async def delete_scan(
     db: AsyncSession = Depends(get_db),
 ):
     """Delete a scan and all its findings."""
-    result = await db.execute(select(Scan).where(Scan.id == scan_id))
-    scan = result.scalar_one_or_none()
+    scan_status = await db.scalar(select(Scan.status).where(Scan.id == scan_id))
 
-    if not scan:
+    if scan_status is None:
         raise HTTPException(status_code=404, detail="Scan not found")
 
     # Prevent deletion of running scans
-    if scan.status == ScanStatus.RUNNING:
+    if scan_status == ScanStatus.RUNNING:
         raise HTTPException(
             status_code=400,
             detail="Cannot delete a running scan. Cancel it first.",
         )
 
-    await db.delete(scan)
+    # Bulk deletes instead of the ORM cascade, which loads every finding to
+    # delete it individually. Findings are removed explicitly because tables
+    # created before the foreign key gained ON DELETE CASCADE keep the old
+    # constraint (create_all never alters existing tables).
+    await db.execute(delete(Finding).where(Finding.scan_id == scan_id))
+    await db.execute(delete(Scan).where(Scan.id == scan_id))
     await db.commit()
+    scan_list_cache.clear()
 
 
 @router.post("/{scan_id}/cancel", response_model=ScanResponse)
@@ -237,20 +258,6 @@ async def cancel_scan(
     scan.status = ScanStatus.CANCELLED
     scan.completed_at = datetime.utcnow()
     await db.commit()
-    await db.refresh(scan)
-
-    return ScanResponse(
-        id=scan.id,
-        name=scan.name,
-        target_path=scan.target_path,
-        rules_path=scan.rules_path,
-        status=scan.status,
-        started_at=scan.started_at,
-        completed_at=scan.completed_at,
-        total_findings=scan.total_findings,
-        validated_findings=scan.validated_findings,
-        created_at=scan.created_at,
-        updated_at=scan.updated_at,
-        progress_percentage=scan.progress_percentage,
-        duration_seconds=scan.duration_seconds,
-    )
+    scan_list_cache.clear()
+
+    return ScanResponse.model_validate(scan)
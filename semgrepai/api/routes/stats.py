@@ -2,12 +2,13 @@
 
 from datetime import datetime, timedelta
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
+from sqlalchemy import select, func, true
 
 from ..db import get_db
-from ..models import Scan, ScanStatus, Finding, TriageStatus
+from ..models import Scan, ScanStatus, Finding, TriageStatus, VerdictKind, SeverityLevel
+from ..services.response_cache import stats_cache
 from ..schemas.common import (
     StatsResponse,
     SeverityDistribution,
@@ -23,111 +24,102 @@ async def get_stats(
     db: AsyncSession = Depends(get_db),
 ):
     """Get overall statistics for the dashboard."""
-    # Scan counts by status
-    scan_counts_query = select(
-        func.count().label("total"),
+    # Dashboard numbers tolerate a little staleness, so the encoded response
+    # is reused for a few seconds instead of re-aggregating both tables
+    cached = stats_cache.get(None)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    # Scan counts by status plus recent activity (last 7 days), and finding
+    # totals and counters: one aggregate per table, fetched in one round trip
+    seven_days_ago = datetime.utcnow() - timedelta(days=7)
+    scan_counts = select(
+        func.count().label("total_scans"),
         func.count().filter(Scan.status == ScanStatus.PENDING).label("pending"),
         func.count().filter(Scan.status == ScanStatus.RUNNING).label("running"),
         func.count().filter(Scan.status == ScanStatus.COMPLETED).label("completed"),
         func.count().filter(Scan.status == ScanStatus.FAILED).label("failed"),
+        func.count().filter(Scan.created_at >= seven_days_ago).label("recent"),
+    ).subquery()
+    finding_counts = select(
+        func.count().label("total_findings"),
+        func.count().filter(Finding.risk_score >= 8).label("critical"),
+        func.count().filter(
+            Finding.triage_status == TriageStatus.NEEDS_REVIEW
+        ).label("needing_review"),
+        func.avg(Finding.risk_score).label("avg_risk"),
+    ).subquery()
+    # Each side is a single row; the explicit join keeps SQLAlchemy from
+    # warning about the cartesian product
+    counts_result = await db.execute(
+        select(scan_counts, finding_counts).join_from(scan_counts, finding_counts, true())
     )
-    scan_counts = await db.execute(scan_counts_query)
-    sc = scan_counts.one()
-
-    # Total findings
-    total_findings = await db.scalar(select(func.count()).select_from(Finding))
-
-    # Severity distribution
-    # Note: Semgrep uses ERROR/WARNING/INFO, map to HIGH/MEDIUM/LOW
-    from sqlalchemy import or_, case
-    severity_query = select(
-        func.sum(case((Finding.severity.ilike("CRITICAL"), 1), else_=0)).label("critical"),
-        func.sum(case((or_(Finding.severity.ilike("HIGH"), Finding.severity.ilike("ERROR")), 1), else_=0)).label("high"),
-        func.sum(case((or_(Finding.severity.ilike("MEDIUM"), Finding.severity.ilike("WARNING")), 1), else_=0)).label("medium"),
-        func.sum(case((Finding.severity.ilike("LOW"), 1), else_=0)).label("low"),
-        func.sum(case((Finding.severity.ilike("INFO"), 1), else_=0)).label("info"),
-    ).select_from(Finding)
-    severity_result = await db.execute(severity_query)
-    sev = severity_result.one()
+    counts = counts_result.one()
+    total_findings = counts.total_findings
+
+    # Severity distribution, grouped on the distinct severity texts and
+    # mapped to levels in Python rather than with ILIKE sums per row
+    severity_query = select(Finding.severity, func.count()).group_by(Finding.severity)
+    severity_counts = dict.fromkeys(SeverityLevel, 0)
+    for severity, count in await db.execute(severity_query):
+        level = SeverityLevel.from_severity(severity)
+        if level is not None:
+            severity_counts[level] += count
 
     severity_distribution = SeverityDistribution(
-        critical=sev.critical or 0,
-        high=sev.high or 0,
-        medium=sev.medium or 0,
-        low=sev.low or 0,
-        info=sev.info or 0,
-        unknown=max(0, total_findings - (sev.critical + sev.high + sev.medium + sev.low + sev.info)),
+        critical=severity_counts[SeverityLevel.CRITICAL],
+        high=severity_counts[SeverityLevel.HIGH],
+        medium=severity_counts[SeverityLevel.MEDIUM],
+        low=severity_counts[SeverityLevel.LOW],
+        info=severity_counts[SeverityLevel.INFO],
+        unknown=(total_findings or 0) - sum(severity_counts.values()),
     )
 
     # Triage distribution
-    triage_query = select(
-        func.count().filter(Finding.triage_status == TriageStatus.NEEDS_REVIEW).label("needs_review"),
-        func.count().filter(Finding.triage_status == TriageStatus.TRUE_POSITIVE).label("true_positive"),
-        func.count().filter(Finding.triage_status == TriageStatus.FALSE_POSITIVE).label("false_positive"),
-        func.count().filter(Finding.triage_status == TriageStatus.ACCEPTED_RISK).label("accepted_risk"),
-        func.count().filter(Finding.triage_status == TriageStatus.FIXED).label("fixed"),
-    )
-    triage_result = await db.execute(triage_query)
-    tri = triage_result.one()
+    triage_query = select(Finding.triage_status, func.count()).group_by(Finding.triage_status)
+    triage_counts = dict.fromkeys(TriageStatus, 0)
+    for triage_status, count in await db.execute(triage_query):
+        triage_counts[triage_status] += count
 
     triage_distribution = TriageDistribution(
-        needs_review=tri.needs_review or 0,
-        true_positive=tri.true_positive or 0,
-        false_positive=tri.false_positive or 0,
-        accepted_risk=tri.accepted_risk or 0,
-        fixed=tri.fixed or 0,
+        needs_review=triage_counts[TriageStatus.NEEDS_REVIEW],
+        true_positive=triage_counts[TriageStatus.TRUE_POSITIVE],
+        false_positive=triage_counts[TriageStatus.FALSE_POSITIVE],
+        accepted_risk=triage_counts[TriageStatus.ACCEPTED_RISK],
+        fixed=triage_counts[TriageStatus.FIXED],
     )
 
-    # Verdict distribution (AI prediction)
-    verdict_query = select(
-        func.count().filter(Finding.verdict.ilike("%true positive%")).label("true_positive"),
-        func.count().filter(Finding.verdict.ilike("%false positive%")).label("false_positive"),
-        func.count().filter(Finding.verdict.ilike("%needs review%")).label("needs_review"),
-        func.count().filter(Finding.verdict.ilike("%error%")).label("error"),
-    )
-    verdict_result = await db.execute(verdict_query)
-    verd = verdict_result.one()
+    # Verdict distribution (AI prediction), grouped on the distinct verdict
+    # texts and classified in Python rather than with ILIKE per row
+    verdict_query = select(Finding.verdict, func.count()).group_by(Finding.verdict)
+    verdict_counts = dict.fromkeys(VerdictKind, 0)
+    for verdict, count in await db.execute(verdict_query):
+        kind = VerdictKind.from_verdict(verdict)
+        if kind is not None:
+            verdict_counts[kind] += count
 
     verdict_distribution = VerdictDistribution(
-        true_positive=verd.true_positive or 0,
-        false_positive=verd.false_positive or 0,
-        needs_review=verd.needs_review or 0,
-        error=verd.error or 0,
-    )
-
-    # Risk metrics
-    avg_risk = await db.scalar(
-        select(func.avg(Finding.risk_score)).where(Finding.risk_score.isnot(None))
-    )
-    critical_findings = await db.scalar(
-        select(func.count()).select_from(Finding).where(Finding.risk_score >= 8)
-    )
-
-    # Recent activity (last 7 days)
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    recent_scans = await db.scalar(
-        select(func.count()).select_from(Scan).where(Scan.created_at >= seven_days_ago)
-    )
-
-    # Findings needing review
-    findings_needing_review = await db.scalar(
-        select(func.count())
-        .select_from(Finding)
-        .where(Finding.triage_status == TriageStatus.NEEDS_REVIEW)
+        true_positive=verdict_counts[VerdictKind.TRUE_POSITIVE],
+        false_positive=verdict_counts[VerdictKind.FALSE_POSITIVE],
+        needs_review=verdict_counts[VerdictKind.NEEDS_REVIEW],
+        error=verdict_counts[VerdictKind.ERROR],
     )
 
-    return StatsResponse(
-        total_scans=sc.total or 0,
+    stats = StatsResponse(
+        total_scans=counts.total_scans or 0,
         total_findings=total_findings or 0,
-        pending_scans=sc.pending or 0,
-        running_scans=sc.running or 0,
-        completed_scans=sc.completed or 0,
-        failed_scans=sc.failed or 0,
+        pending_scans=counts.pending or 0,
+        running_scans=counts.running or 0,
+        completed_scans=counts.completed or 0,
+        failed_scans=counts.failed or 0,
         severity_distribution=severity_distribution,
         triage_distribution=triage_distribution,
         verdict_distribution=verdict_distribution,
-        average_risk_score=float(avg_risk or 0),
-        critical_findings_count=critical_findings or 0,
-        recent_scans_count=recent_scans or 0,
-        findings_needing_review=findings_needing_review or 0,
+        average_risk_score=float(counts.avg_risk or 0),
+        critical_findings_count=counts.critical or 0,
+        recent_scans_count=counts.recent or 0,
+        findings_needing_review=counts.needing_review or 0,
     )
+    body = stats.model_dump_json().encode()
+    stats_cache.set(None, body)
+    return Response(content=body, media_type="application/json")
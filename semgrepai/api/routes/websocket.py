@@ -1,63 +1,121 @@
 """WebSocket routes for real-time scan progress."""
 
 import asyncio
-from typing import Dict, List
-import json
+from typing import Any, Dict
 
+import orjson
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
 from datetime import datetime
 
 router = APIRouter()
 
 
+def _encode(message: Dict[str, Any]) -> str:
+    """Encode a message for a text frame; orjson handles datetimes natively."""
+    return orjson.dumps(message).decode()
+
+
+# Fixed control frames, filled with the JSON-encoded scan ID and timestamp
+_CONNECTED_TEMPLATE = (
+    '{"type":"connected","scan_id":%s,'
+    '"data":{"message":"Connected to scan progress updates"},"timestamp":%s}'
+)
+_PONG_TEMPLATE = '{"type":"pong","scan_id":%s,"timestamp":%s}'
+
+# Frames buffered per socket before the oldest are dropped for a slow client
+OUTBOX_SIZE = 64
+
+# Backlog at which intermediate progress frames are skipped for a client
+BACKLOG_THRESHOLD = OUTBOX_SIZE * 3 // 4
+
+
+def _timestamp() -> str:
+    """Current UTC time as a JSON string literal."""
+    return orjson.dumps(datetime.utcnow()).decode()
+
+
+def _put_latest(outbox: asyncio.Queue, payload: str):
+    """Queue a frame, dropping the oldest one if the client has fallen behind."""
+    if outbox.full():
+        outbox.get_nowait()
+    outbox.put_nowait(payload)
+
+
 class ConnectionManager:
-    """Manage WebSocket connections for scan progress updates."""
+    """Manage WebSocket connections for scan progress updates.
+
+    Each socket has a bounded outbox drained by its own relay task, so a
+    broadcast only queues the encoded frame and a slow client never holds up
+    the scan or the other watchers. A client more than OUTBOX_SIZE frames
+    behind loses its oldest frames. The maps are only touched between awaits
+    on the event loop, so every update is atomic without a lock.
+    """
 
     def __init__(self):
-        self.active_connections: Dict[str, List[WebSocket]] = {}
-        self._lock = asyncio.Lock()
+        self.active_connections: Dict[str, Dict[WebSocket, asyncio.Queue]] = {}
+        self._relays: Dict[WebSocket, asyncio.Task] = {}
 
     async def connect(self, websocket: WebSocket, scan_id: str):
         """Accept a WebSocket connection and track it by scan ID."""
         await websocket.accept()
-        async with self._lock:
-            if scan_id not in self.active_connections:
-                self.active_connections[scan_id] = []
-            self.active_connections[scan_id].append(websocket)
+        outbox: asyncio.Queue = asyncio.Queue(maxsize=OUTBOX_SIZE)
+        self.active_connections.setdefault(scan_id, {})[websocket] = outbox
+        self._relays[websocket] = asyncio.create_task(
+            self._relay(websocket, scan_id, outbox)
+        )
 
     async def disconnect(self, websocket: WebSocket, scan_id: str):
-        """Remove a WebSocket connection."""
-        async with self._lock:
-            if scan_id in self.active_connections:
-                if websocket in self.active_connections[scan_id]:
-                    self.active_connections[scan_id].remove(websocket)
-                if not self.active_connections[scan_id]:
-                    del self.active_connections[scan_id]
-
-    async def broadcast_to_scan(self, scan_id: str, message: dict):
-        """Broadcast a message to all connections watching a specific scan."""
-        async with self._lock:
-            connections = self.active_connections.get(scan_id, [])
-
-        # Send to all connections outside the lock to avoid holding it too long
-        disconnected = []
-        for connection in connections:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                disconnected.append(connection)
-
-        # Clean up disconnected clients
-        if disconnected:
-            async with self._lock:
-                for conn in disconnected:
-                    if scan_id in self.active_connections:
-                        if conn in self.active_connections[scan_id]:
-                            self.active_connections[scan_id].remove(conn)
+        """Remove a WebSocket connection and stop its relay."""
+        connections = self.active_connections.get(scan_id)
+        if connections is not None:
+            connections.pop(websocket, None)
+            if not connections:
+                del self.active_connections[scan_id]
+        relay = self._relays.pop(websocket, None)
+        if relay is not None and relay is not asyncio.current_task():
+            relay.cancel()
+
+    def send(self, websocket: WebSocket, scan_id: str, payload: str):
+        """Queue an encoded frame for a single connection."""
+        outbox = self.active_connections.get(scan_id, {}).get(websocket)
+        if outbox is not None:
+            _put_latest(outbox, payload)
+
+    async def broadcast_to_scan(self, scan_id: str, message: dict, droppable: bool = False):
+        """Broadcast a message to all connections watching a specific scan.
+
+        Droppable messages (intermediate progress) are not queued for a
+        watcher whose outbox is past BACKLOG_THRESHOLD, so a slow client
+        catches up on the next update instead of replaying stale ones.
+        """
+        connections = self.active_connections.get(scan_id)
+        if not connections:
+            return
+
+        # Encode once and queue the same frame for every watcher
+        payload = _encode(message)
+        for outbox in connections.values():
+            if droppable and outbox.qsize() >= BACKLOG_THRESHOLD:
+                continue
+            _put_latest(outbox, payload)
+
+    async def _relay(self, websocket: WebSocket, scan_id: str, outbox: asyncio.Queue):
+        """Send queued frames to one socket until it fails or disconnects."""
+        try:
+            while True:
+                await websocket.send_text(await outbox.get())
+        except Exception:
+            # Clean up disconnected clients
+            await self.disconnect(websocket, scan_id)
 
     def get_connection_count(self, scan_id: str) -> int:
         """Get number of active connections for a scan."""
-        return len(self.active_connections.get(scan_id, []))
+        return len(self.active_connections.get(scan_id, ()))
+
+    def get_queue_depth(self, scan_id: str) -> int:
+        """Get the deepest outbox backlog among a scan's connections."""
+        outboxes = self.active_connections.get(scan_id, {}).values()
+        return max((outbox.qsize() for outbox in outboxes), default=0)
 
 
 # Global connection manager instance
@@ -104,46 +162,24 @@ async def websocket_scan_progress(
     ```
     """
     await manager.connect(websocket, scan_id)
+    scan_id_json = orjson.dumps(scan_id).decode()
 
     # Send initial connection confirmation
-    await websocket.send_json({
-        "type": "connected",
-        "scan_id": scan_id,
-        "data": {"message": "Connected to scan progress updates"},
-        "timestamp": datetime.utcnow().isoformat(),
-    })
+    manager.send(websocket, scan_id, _CONNECTED_TEMPLATE % (scan_id_json, _timestamp()))
 
     try:
+        # Liveness is checked with protocol-level ping/pong frames by the ASGI
+        # server, so the loop only wakes up when the client sends something
         while True:
-            # Keep connection alive and handle any client messages
+            data = await websocket.receive_text()
+
+            # Handle client messages if needed
             try:
-                data = await asyncio.wait_for(
-                    websocket.receive_text(),
-                    timeout=30.0  # Send ping every 30 seconds
-                )
-
-                # Handle client messages if needed
-                try:
-                    message = json.loads(data)
-                    if message.get("type") == "ping":
-                        await websocket.send_json({
-                            "type": "pong",
-                            "scan_id": scan_id,
-                            "timestamp": datetime.utcnow().isoformat(),
-                        })
-                except json.JSONDecodeError:
-                    pass
-
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                try:
-                    await websocket.send_json({
-                        "type": "ping",
-                        "scan_id": scan_id,
-                        "timestamp": datetime.utcnow().isoformat(),
-                    })
-                except Exception:
-                    break
+                message = orjson.loads(data)
+                if message.get("type") == "ping":
+                    manager.send(websocket, scan_id, _PONG_TEMPLATE % (scan_id_json, _timestamp()))
+            except orjson.JSONDecodeError:
+                pass
 
     except WebSocketDisconnect:
         pass
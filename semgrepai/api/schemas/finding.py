@@ -2,13 +2,15 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..models.finding import TriageStatus
 
 
 class FindingResponse(BaseModel):
     """Schema for finding response in list views."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     scan_id: str
     rule_id: str
@@ -28,9 +30,6 @@ class FindingResponse(BaseModel):
 
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class FindingDetailResponse(FindingResponse):
     """Schema for detailed finding response."""
@@ -43,7 +42,7 @@ class FindingDetailResponse(FindingResponse):
     impact_assessment: Optional[Dict[str, Any]]
     vulnerability_category: Optional[Dict[str, Any]]
     technical_details: Optional[Dict[str, Any]]
-    semgrep_metadata: Optional[Dict[str, Any]] = Field(default=None, alias="metadata")
+    semgrep_metadata: Optional[Dict[str, Any]] = Field(default=None, serialization_alias="metadata")
 
     # Triage details
     triage_note: Optional[str]
@@ -54,9 +53,6 @@ class FindingDetailResponse(FindingResponse):
     processing_time: Optional[float]
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class FindingUpdate(BaseModel):
     """Schema for updating a finding's triage status."""
@@ -2,7 +2,7 @@
 
 from typing import Optional, List, Dict, Any
 from datetime import datetime
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from ..models.scan import ScanStatus
 
@@ -24,6 +24,8 @@ class ScanCreate(BaseModel):
 
 class ScanResponse(BaseModel):
     """Schema for scan response."""
+    model_config = ConfigDict(from_attributes=True)
+
     id: str
     name: Optional[str]
     target_path: str
@@ -40,17 +42,16 @@ class ScanResponse(BaseModel):
     progress_percentage: float = 0.0
     duration_seconds: Optional[float] = None
 
-    class Config:
-        from_attributes = True
-
 
 class ScanListResponse(BaseModel):
     """Schema for list of scans."""
     items: List[ScanResponse]
-    total: int
+    total: Optional[int] = None
     page: int
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    has_more: bool = False
+    next_cursor: Optional[str] = None
 
 
 class ScanDetailResponse(ScanResponse):
@@ -69,9 +70,6 @@ class ScanDetailResponse(ScanResponse):
     severity_medium: int = 0
     severity_low: int = 0
 
-    class Config:
-        from_attributes = True
-
 
 class ScanProgress(BaseModel):
     """Schema for scan progress updates via WebSocket."""
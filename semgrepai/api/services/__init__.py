@@ -1,5 +1,5 @@
 """API services for business logic."""
 
-from .scan_service import ScanService
+from .scan_service import ScanService, cancel_running_scans, start_scan
 
-__all__ = ["ScanService"]
+__all__ = ["ScanService", "start_scan", "cancel_running_scans"]
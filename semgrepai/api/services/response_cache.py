@@ -0,0 +1,43 @@
+"""Short-lived in-process cache for encoded API responses."""
+
+import time
+from typing import Dict, Hashable, Optional, Tuple
+
+
+class ResponseCache:
+    """Keep encoded response bodies for a few seconds.
+
+    Entries expire ``ttl`` seconds after they are stored. Routes that change
+    the cached data call ``clear()`` so their own writes show up immediately.
+    """
+
+    def __init__(self, ttl: float, max_entries: int = 256):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[float, bytes]] = {}
+
+    def get(self, key: Hashable) -> Optional[bytes]:
+        """Return the cached body for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[key]
+            return None
+        return entry[1]
+
+    def set(self, key: Hashable, body: bytes):
+        """Store a body, evicting the oldest entry when the cache is full."""
+        if key not in self._entries and len(self._entries) >= self.max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic(), body)
+
+    def clear(self):
+        """Drop every entry."""
+        self._entries.clear()
+
+
+# Scan listings change on every status transition, so they are kept briefly;
+# dashboard stats tolerate more staleness.
+scan_list_cache = ResponseCache(ttl=3.0)
+stats_cache = ResponseCache(ttl=10.0, max_entries=1)
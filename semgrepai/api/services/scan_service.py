@@ -1,13 +1,15 @@
 """Scan service for orchestrating security scans."""
 
 import asyncio
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, insert
 
+from ..db import AsyncSessionLocal
 from ..models import Scan, ScanStatus, Finding
 from ..routes.websocket import get_connection_manager
 from ...scanner import SemgrepScanner
@@ -17,6 +19,39 @@ from ...logging import get_logger
 
 logger = get_logger(__name__)
 
+# Seconds between writes of a running scan's validated_findings counter
+PROGRESS_PERSIST_INTERVAL = 1.0
+
+# Scans running in this process. The event loop only keeps weak references
+# to tasks, so they are held here until they finish.
+_running_scans: Set[asyncio.Task] = set()
+
+
+def start_scan(scan_id: str) -> asyncio.Task:
+    """
+    Run a scan as its own task with its own database session.
+
+    Unlike a request background task, the scan does not hold on to the
+    request's session or delay the worker that served the request.
+    """
+    task = asyncio.create_task(_run_scan_task(scan_id), name=f"scan-{scan_id}")
+    _running_scans.add(task)
+    task.add_done_callback(_running_scans.discard)
+    return task
+
+
+async def cancel_running_scans():
+    """Cancel scans still running in this process and wait for them to stop."""
+    tasks = list(_running_scans)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def _run_scan_task(scan_id: str):
+    async with AsyncSessionLocal() as db:
+        await ScanService(db).run_scan(scan_id)
+
 
 class ScanService:
     """Service for running and managing security scans."""
@@ -31,6 +66,7 @@ class ScanService:
 
         This method is designed to run as a background task.
         """
+        scan = None
         try:
             # Get scan from database
             result = await self.db.execute(select(Scan).where(Scan.id == scan_id))
@@ -63,7 +99,9 @@ class ScanService:
                 target_path = Path(scan.target_path)
                 rules_path = Path(scan.rules_path) if scan.rules_path else None
 
-                results = scanner.scan(target_path, rules_path)
+                # Semgrep runs as a blocking subprocess; keep it off the event
+                # loop so API requests are served while it runs
+                results = await asyncio.to_thread(scanner.scan, target_path, rules_path)
 
                 if not results or not results.get("json", {}).get("results"):
                     scan.status = ScanStatus.COMPLETED
@@ -112,11 +150,18 @@ class ScanService:
             try:
                 validator = AIValidator()
 
-                # Create progress tracker with WebSocket callback
-                progress_tracker = AsyncProgressTracker(len(findings_data))
+                # Create progress tracker with WebSocket callback. Updates are
+                # coalesced, so the callback runs at most twice a second however
+                # fast findings are validated
+                progress_tracker = AsyncProgressTracker(len(findings_data), min_interval_s=0.5)
+
+                # Progress is persisted for polling clients at most once per
+                # PROGRESS_PERSIST_INTERVAL; the final count is written on completion
+                last_persisted = 0.0
 
                 async def ws_callback(update: ProgressUpdate):
                     """Callback to send progress updates via WebSocket."""
+                    nonlocal last_persisted
                     await self._broadcast_progress(scan_id, {
                         "type": "progress",
                         "status": "running",
@@ -128,8 +173,11 @@ class ScanService:
                     })
 
                     # Update scan in database
-                    scan.validated_findings = update.processed
-                    await self.db.commit()
+                    now = time.monotonic()
+                    if now - last_persisted >= PROGRESS_PERSIST_INTERVAL:
+                        last_persisted = now
+                        scan.validated_findings = update.processed
+                        await self.db.commit()
 
                 progress_tracker.add_callback(ws_callback)
 
@@ -139,10 +187,14 @@ class ScanService:
                     progress_tracker=progress_tracker,
                 )
 
-                # Store findings in database
-                for finding_dict in validated_findings:
-                    finding = Finding.from_scan_finding(scan_id, finding_dict)
-                    self.db.add(finding)
+                # Store findings in database with a single bulk INSERT. The
+                # table-level insert is a plain Core executemany; the rows never
+                # pass through the ORM's bulk persistence
+                if validated_findings:
+                    await self.db.execute(
+                        insert(Finding.__table__),
+                        Finding.rows_from_scan(scan_id, validated_findings),
+                    )
 
                 scan.validated_findings = len(validated_findings)
                 scan.status = ScanStatus.COMPLETED
@@ -174,8 +226,11 @@ class ScanService:
         except Exception as e:
             logger.error(f"Scan {scan_id} failed with unexpected error: {e}", exc_info=True)
             try:
-                result = await self.db.execute(select(Scan).where(Scan.id == scan_id))
-                scan = result.scalar_one_or_none()
+                # The failed flush may have left the transaction unusable; the
+                # scan loaded above stays in the session and is reused
+                await self.db.rollback()
+                if scan is None:
+                    scan = await self.db.get(Scan, scan_id)
                 if scan:
                     scan.status = ScanStatus.FAILED
                     scan.completed_at = datetime.utcnow()
@@ -192,9 +247,15 @@ class ScanService:
 
     async def _broadcast_progress(self, scan_id: str, data: dict):
         """Broadcast progress update to WebSocket clients."""
+        # The message is encoded once for all watchers, which formats the
+        # datetime natively; no isoformat() string is built here
         message = {
             **data,
             "scan_id": scan_id,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.utcnow(),
         }
-        await self.ws_manager.broadcast_to_scan(scan_id, message)
+        # Intermediate progress is superseded by the next update, so it may
+        # be skipped for watchers that are falling behind
+        await self.ws_manager.broadcast_to_scan(
+            scan_id, message, droppable=data["type"] == "progress"
+        )
@@ -16,6 +16,13 @@ class ProgressStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+_FINAL_STATUSES = (
+    ProgressStatus.COMPLETED,
+    ProgressStatus.FAILED,
+    ProgressStatus.CANCELLED,
+)
+
+
 @dataclass
 class ProgressUpdate:
     """Represents a progress update."""
@@ -51,11 +58,7 @@ class ProgressUpdate:
     @property
     def is_complete(self) -> bool:
         """Check if processing is complete."""
-        return self.status in (
-            ProgressStatus.COMPLETED,
-            ProgressStatus.FAILED,
-            ProgressStatus.CANCELLED,
-        )
+        return self.status in _FINAL_STATUSES
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -97,9 +100,15 @@ class AsyncProgressTracker:
 
         # Complete
         await tracker.complete()
+
+    Once started, updates are coalesced: callbacks see the latest state at
+    most once per ``min_interval_s`` (or sooner, once ``min_delta`` more
+    items are processed) instead of once per change. ``start()`` and the
+    final transitions are always delivered right away. With
+    ``min_interval_s=0`` every change is delivered immediately.
     """
 
-    def __init__(self, total: int):
+    def __init__(self, total: int, min_interval_s: float = 0.1, min_delta: int = 0):
         self._total = total
         self._processed = 0
         self._status = ProgressStatus.PENDING
@@ -115,7 +124,17 @@ class AsyncProgressTracker:
         self._started_at: Optional[datetime] = None
         self._error_message: Optional[str] = None
         self._callbacks: list[ProgressCallback] = []
-        self._lock = asyncio.Lock()
+        # No lock: state changes never await, so each one is atomic on the
+        # event loop
+
+        # Coalescing state: _dirty marks undelivered changes, _flush_now cuts
+        # the wait short, and _flush_task delivers them while running
+        self._min_interval_s = min_interval_s
+        self._min_delta = min_delta
+        self._notified_processed = 0
+        self._dirty = asyncio.Event()
+        self._flush_now = asyncio.Event()
+        self._flush_task: Optional[asyncio.Task] = None
 
     @property
     def current_update(self) -> ProgressUpdate:
@@ -140,21 +159,71 @@ class AsyncProgressTracker:
             self._callbacks.remove(callback)
 
     async def _notify_callbacks(self):
-        """Notify all callbacks of progress update."""
+        """Notify all callbacks of progress update and return the update sent.
+
+        Callbacks run concurrently; their errors are collected and dropped so
+        they don't stop processing.
+        """
         update = self.current_update
-        for callback in self._callbacks:
-            try:
-                await callback(update)
-            except Exception:
-                # Don't let callback errors stop processing
-                pass
+        self._notified_processed = update.processed
+        await asyncio.gather(
+            *(callback(update) for callback in self._callbacks),
+            return_exceptions=True,
+        )
+        return update
+
+    async def _flush_loop(self):
+        """Deliver coalesced updates until a final state has been delivered."""
+        while True:
+            await self._dirty.wait()
+            if not self._flush_now.is_set():
+                try:
+                    await asyncio.wait_for(self._flush_now.wait(), self._min_interval_s)
+                except asyncio.TimeoutError:
+                    pass
+            self._dirty.clear()
+            self._flush_now.clear()
+            # Check the state that was delivered: complete() may have run
+            # while the callbacks were awaited, and that update is still due
+            update = await self._notify_callbacks()
+            if update.status in _FINAL_STATUSES:
+                return
+
+    async def _changed(self):
+        """Schedule delivery of a change, or deliver it now when not coalescing."""
+        if self._flush_task is None:
+            await self._notify_callbacks()
+            return
+        if self._min_delta and self._processed - self._notified_processed >= self._min_delta:
+            self._flush_now.set()
+        self._dirty.set()
+
+    async def _finished(self):
+        """Deliver the final state and stop the flush task."""
+        if self._flush_task is None:
+            await self._notify_callbacks()
+            return
+        self._flush_now.set()
+        self._dirty.set()
+        await self._flush_task
+        self._flush_task = None
 
     async def start(self):
         """Mark processing as started."""
-        async with self._lock:
-            self._status = ProgressStatus.RUNNING
-            self._started_at = datetime.utcnow()
+        self._status = ProgressStatus.RUNNING
+        self._started_at = datetime.utcnow()
         await self._notify_callbacks()
+        if self._min_interval_s > 0 and self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_loop())
+            # Don't leave the flusher waiting forever if the caller is cancelled
+            owner = asyncio.current_task()
+            if owner is not None:
+                owner.add_done_callback(self._stop_flusher)
+
+    def _stop_flusher(self, _owner: asyncio.Task):
+        """Cancel the flush task once the task that started it is done."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
 
     async def update(
         self,
@@ -172,51 +241,46 @@ class AsyncProgressTracker:
             current_item: Details about current item being processed
             metrics_update: Dictionary to update metrics with
         """
-        async with self._lock:
-            if processed is not None:
-                self._processed = processed
-            else:
-                self._processed += increment
+        if processed is not None:
+            self._processed = processed
+        else:
+            self._processed += increment
 
-            if current_item is not None:
-                self._current_item = current_item
+        if current_item is not None:
+            self._current_item = current_item
 
-            if metrics_update:
-                self._metrics.update(metrics_update)
+        if metrics_update:
+            self._metrics.update(metrics_update)
 
-        await self._notify_callbacks()
+        await self._changed()
 
     async def increment_metric(self, metric_name: str, amount: int = 1):
         """Increment a specific metric."""
-        async with self._lock:
-            if metric_name in self._metrics:
-                self._metrics[metric_name] += amount
-            else:
-                self._metrics[metric_name] = amount
-        await self._notify_callbacks()
+        if metric_name in self._metrics:
+            self._metrics[metric_name] += amount
+        else:
+            self._metrics[metric_name] = amount
+        await self._changed()
 
     async def complete(self):
         """Mark processing as completed."""
-        async with self._lock:
-            self._status = ProgressStatus.COMPLETED
-            self._processed = self._total
-            self._current_item = None
-        await self._notify_callbacks()
+        self._status = ProgressStatus.COMPLETED
+        self._processed = self._total
+        self._current_item = None
+        await self._finished()
 
     async def fail(self, error_message: str):
         """Mark processing as failed."""
-        async with self._lock:
-            self._status = ProgressStatus.FAILED
-            self._error_message = error_message
-            self._current_item = None
-        await self._notify_callbacks()
+        self._status = ProgressStatus.FAILED
+        self._error_message = error_message
+        self._current_item = None
+        await self._finished()
 
     async def cancel(self):
         """Mark processing as cancelled."""
-        async with self._lock:
-            self._status = ProgressStatus.CANCELLED
-            self._current_item = None
-        await self._notify_callbacks()
+        self._status = ProgressStatus.CANCELLED
+        self._current_item = None
+        await self._finished()
 
 
 class MultiProgressTracker:
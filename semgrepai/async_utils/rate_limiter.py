@@ -1,7 +1,6 @@
 """Async rate limiter with exponential backoff for LLM API calls."""
 
 import asyncio
-import random
 import logging
 from dataclasses import dataclass, field
 from typing import TypeVar, Callable, Awaitable, Optional
@@ -9,9 +8,11 @@ from functools import wraps
 
 from aiolimiter import AsyncLimiter
 from tenacity import (
+    AsyncRetrying,
     retry,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
     retry_if_exception_type,
     before_sleep_log,
 )
@@ -65,8 +66,8 @@ class AsyncRateLimiter:
             async with limiter:
                 return await api_call()
 
-        # Or with retry logic
-        result = await limiter.execute_with_retry(api_call())
+        # Or with retry logic; pass the function so each attempt gets a fresh coroutine
+        result = await limiter.execute_with_retry(api_call)
     """
 
     def __init__(self, config: Optional[RateLimitConfig] = None):
@@ -77,19 +78,37 @@ class AsyncRateLimiter:
             time_period=60
         )
         self._request_count = 0
-        self._lock = asyncio.Lock()
+        self._in_flight = 0
 
     async def __aenter__(self):
         """Context manager entry - acquire semaphore and rate limit token."""
+        await self._acquire_slot()
+        try:
+            await self._acquire_token()
+        except BaseException:
+            self._release_slot()
+            raise
+        return self
+
+    async def _acquire_slot(self):
+        """Wait for a concurrency slot."""
         await self._semaphore.acquire()
+        self._in_flight += 1
+
+    def _release_slot(self):
+        """Give a concurrency slot back."""
+        self._in_flight -= 1
+        self._semaphore.release()
+
+    async def _acquire_token(self):
+        """Wait for a rate limit token and count the request."""
         await self._rate_limiter.acquire()
-        async with self._lock:
-            self._request_count += 1
-        return self
+        # No await between read and write, so the increment is atomic
+        self._request_count += 1
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - release semaphore."""
-        self._semaphore.release()
+        self._release_slot()
         return False
 
     @property
@@ -100,28 +119,19 @@ class AsyncRateLimiter:
     @property
     def available_slots(self) -> int:
         """Number of available concurrent slots."""
-        return self._semaphore._value
-
-    def _calculate_backoff(self, attempt: int) -> float:
-        """Calculate exponential backoff delay with optional jitter."""
-        delay = min(
-            self.config.base_delay * (2 ** attempt),
-            self.config.max_delay
-        )
-        if self.config.jitter:
-            delay += random.uniform(0, delay * 0.1)
-        return delay
+        return self.config.max_concurrent - self._in_flight
 
     async def execute_with_retry(
         self,
-        coro: Awaitable[T],
+        coro_factory: Callable[[], Awaitable[T]],
         retry_exceptions: tuple = (Exception,),
     ) -> T:
         """
         Execute a coroutine with rate limiting and retry logic.
 
         Args:
-            coro: The coroutine to execute
+            coro_factory: Callable returning a new coroutine for each attempt
+                (a coroutine object can only be awaited once)
             retry_exceptions: Tuple of exception types to retry on
 
         Returns:
@@ -130,30 +140,34 @@ class AsyncRateLimiter:
         Raises:
             MaxRetriesExceeded: If all retry attempts fail
         """
-        last_exception = None
-
-        for attempt in range(self.config.max_retries):
-            try:
-                async with self:
-                    return await coro
-            except retry_exceptions as e:
-                last_exception = e
-
-                if attempt < self.config.max_retries - 1:
-                    delay = self._calculate_backoff(attempt)
-                    logger.warning(
-                        f"Request failed (attempt {attempt + 1}/{self.config.max_retries}): {e}. "
-                        f"Retrying in {delay:.2f}s..."
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    logger.error(
-                        f"Request failed after {self.config.max_retries} attempts: {e}"
-                    )
-
-        raise MaxRetriesExceeded(
-            f"Failed after {self.config.max_retries} attempts"
-        ) from last_exception
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.config.max_retries),
+            wait=wait_exponential(
+                multiplier=self.config.base_delay, max=self.config.max_delay
+            ) + wait_random(0, self.config.base_delay if self.config.jitter else 0),
+            retry=retry_if_exception_type(retry_exceptions),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        )
+
+        # The concurrency slot is held across attempts, so a failing request
+        # backs off without releasing it into a burst of fresh requests; each
+        # attempt still takes its own rate limit token
+        await self._acquire_slot()
+        try:
+            async for attempt in retrying:
+                with attempt:
+                    await self._acquire_token()
+                    return await coro_factory()
+        except retry_exceptions as e:
+            logger.error(
+                f"Request failed after {self.config.max_retries} attempts: {e}"
+            )
+            raise MaxRetriesExceeded(
+                f"Failed after {self.config.max_retries} attempts"
+            ) from e
+        finally:
+            self._release_slot()
 
 
 def with_rate_limit(
@@ -175,7 +189,7 @@ def with_rate_limit(
         async def wrapper(*args, **kwargs) -> T:
             async def _call():
                 return await func(*args, **kwargs)
-            return await limiter.execute_with_retry(_call(), retry_exceptions)
+            return await limiter.execute_with_retry(_call, retry_exceptions)
         return wrapper
     return decorator
 
@@ -1,70 +1,243 @@
 from pathlib import Path
-import json
-import hashlib
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
 from typing import Dict, Any, Optional
-import os
-from datetime import datetime, timedelta
+
+import orjson
+
+
+# Update in place on conflict; INSERT OR REPLACE would delete and re-insert the row
+_UPSERT = "INSERT INTO kv (k, v, ts) VALUES (?, ?, ?) ON CONFLICT(k) DO UPDATE SET v = excluded.v, ts = excluded.ts"
+
+
+def _dumps(value: Dict[str, Any]) -> bytes:
+    """Encode a validation result; non-string keys are stringified like json does."""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+
 
 class ValidationCache:
-    """Cache for storing validation results to avoid redundant LLM calls."""
+    """Cache for storing validation results to avoid redundant LLM calls.
+
+    Entries live in a SQLite database in the cache directory, so a lookup or
+    insert touches a single row instead of loading or rewriting the whole
+    cache. Async callers use aget()/aset(), which keep the database work off
+    the event loop and batch writes. Recently used results are also kept
+    decoded in a small in-memory LRU tier; treat returned dicts as read-only.
+    """
 
-    def __init__(self, cache_dir: Path, max_entries: int = 10000, auto_cleanup_interval: int = 100):
+    def __init__(
+        self,
+        cache_dir: Path,
+        max_entries: int = 10000,
+        auto_cleanup_interval: int = 100,
+        flush_interval_s: float = 0.5,
+        hot_entries: int = 512,
+    ):
         """Initialize the validation cache.
 
         Args:
             cache_dir: Directory to store cache files
-            max_entries: Maximum number of cache entries (for LRU eviction)
+            max_entries: Maximum number of cache entries (oldest are evicted first)
             auto_cleanup_interval: How often to run cleanup (every N operations)
+            flush_interval_s: How long aset() writes are collected before flushing
+            hot_entries: Number of recently used results kept in memory
         """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self.cache_file = self.cache_dir / "validation_cache.json"
+        self.cache_file = self.cache_dir / "validation_cache.sqlite"
         self.max_entries = max_entries
         self.auto_cleanup_interval = auto_cleanup_interval
+        self.hits = 0
+        self.misses = 0
         self._operation_count = 0
-        self._load_cache()
+        self.flush_interval_s = flush_interval_s
+        self.hot_entries = hot_entries
+        self._hot: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._conn = self._connect()
+        self._import_json_cache()
 
-    def _load_cache(self):
-        """Load the cache from disk."""
-        if self.cache_file.exists():
-            try:
-                with open(self.cache_file, 'r') as f:
-                    self.cache = json.load(f)
-            except json.JSONDecodeError:
-                self.cache = {}
-        else:
-            self.cache = {}
-
-    def _save_cache(self):
-        """Save the cache to disk."""
-        with open(self.cache_file, 'w') as f:
-            json.dump(self.cache, f, indent=2)
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database and create its table."""
+        conn = sqlite3.connect(self.cache_file, check_same_thread=False, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        # Keep the eviction sort and a decent page cache in memory
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-20000")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS kv (k TEXT PRIMARY KEY, v BLOB NOT NULL, ts INTEGER NOT NULL)"
+        )
+        # Lets eviction walk entries newest first instead of sorting the table
+        conn.execute("CREATE INDEX IF NOT EXISTS kv_ts ON kv (ts)")
+        return conn
+
+    def _import_json_cache(self):
+        """Move entries from the old validation_cache.json file, if present."""
+        json_file = self.cache_dir / "validation_cache.json"
+        if not json_file.exists():
+            return
+        try:
+            entries = orjson.loads(json_file.read_bytes())
+        except orjson.JSONDecodeError:
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+        self.set_many(entries)
+        json_file.unlink()
+
+    def _remember(self, key: str, value: Dict[str, Any]):
+        """Put a result at the recent end of the hot tier. Caller holds the lock."""
+        self._hot[key] = value
+        self._hot.move_to_end(key)
+        if len(self._hot) > self.hot_entries:
+            self._hot.popitem(last=False)
+
+    def _cleanup(self):
+        """Evict the oldest entries beyond max_entries."""
+        evicted = "SELECT k FROM kv ORDER BY ts DESC, rowid DESC LIMIT -1 OFFSET ?"
+        for (key,) in self._conn.execute(evicted, (self.max_entries,)).fetchall():
+            self._hot.pop(key, None)
+        self._conn.execute(f"DELETE FROM kv WHERE k IN ({evicted})", (self.max_entries,))
 
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """Get a cached validation result.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached validation result or None if not found
         """
-        if key in self.cache:
-            return self.cache[key]
-        return None
+        with self._lock:
+            value = self._hot.get(key)
+            if value is not None:
+                self._hot.move_to_end(key)
+                self.hits += 1
+                return value
+            row = self._conn.execute("SELECT v FROM kv WHERE k = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            value = orjson.loads(row[0])
+            self._remember(key, value)
+            return value
 
     def set(self, key: str, value: Dict[str, Any]):
         """Set a validation result in the cache.
-        
+
+        Args:
+            key: Cache key
+            value: Validation result to cache
+        """
+        with self._lock:
+            self._conn.execute(_UPSERT, (key, _dumps(value), int(time.time())))
+            self._remember(key, value)
+            self._operation_count += 1
+            if self._operation_count % self.auto_cleanup_interval == 0:
+                self._cleanup()
+
+    def set_many(self, entries: Dict[str, Dict[str, Any]]):
+        """Set several validation results in one transaction.
+
+        Args:
+            entries: Mapping of cache key to validation result
+        """
+        if not entries:
+            return
+        now = int(time.time())
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    _UPSERT, ((key, _dumps(value), now) for key, value in entries.items())
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            for key, value in entries.items():
+                self._remember(key, value)
+            previous = self._operation_count
+            self._operation_count += len(entries)
+            if self._operation_count // self.auto_cleanup_interval > previous // self.auto_cleanup_interval:
+                self._cleanup()
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get a cached validation result without blocking the event loop.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached validation result or None if not found
+        """
+        if key in self._pending:
+            self.hits += 1
+            return self._pending[key]
+        with self._lock:
+            value = self._hot.get(key)
+            if value is not None:
+                self._hot.move_to_end(key)
+                self.hits += 1
+                return value
+        return await asyncio.to_thread(self.get, key)
+
+    async def aset(self, key: str, value: Dict[str, Any]):
+        """Queue a validation result to be written with the next batch.
+
         Args:
             key: Cache key
             value: Validation result to cache
         """
-        self.cache[key] = value
-        self._save_cache()
+        self._pending[key] = value
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        """Flush queued writes after the flush interval."""
+        await asyncio.sleep(self.flush_interval_s)
+        await self.aflush()
+
+    async def aflush(self):
+        """Write all queued results in a worker thread."""
+        pending = dict(self._pending)
+        if not pending:
+            return
+        await asyncio.to_thread(self.set_many, pending)
+        # Keep anything re-queued while the batch was being written
+        for key, value in pending.items():
+            if self._pending.get(key) is value:
+                del self._pending[key]
+
+    async def aclose(self):
+        """Flush queued writes and close the cache database."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self.aflush()
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of cached validation results."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM kv").fetchone()[0]
 
     def clear(self):
-        """Clear the cache."""
-        self.cache = {}
-        if self.cache_file.exists():
-            self.cache_file.unlink()
\ No newline at end of file
+        """Clear the cache, including writes queued by aset()."""
+        self._pending.clear()
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        with self._lock:
+            self._conn.execute("DELETE FROM kv")
+            self._hot.clear()
+
+    def close(self):
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
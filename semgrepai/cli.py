@@ -87,9 +87,9 @@ def scan(
                             console.print(f"  Hit Rate: {cache_stats.get('hit_rate', 'N/A')}")
                             console.print(f"  Total Entries: {cache_stats.get('total_entries', 0)}")
                             console.print(f"  Capacity: {cache_stats.get('capacity_used', 'N/A')}")
-                        elif hasattr(validator.cache, 'cache'):
+                        else:
                             console.print(f"\n[bold green]Cache Performance:[/bold green]")
-                            console.print(f"  Total Entries: {len(validator.cache.cache)}")
+                            console.print(f"  Total Entries: {len(validator.cache)}")
                     except Exception:
                         pass  # Cache stats are optional
 
@@ -163,6 +163,9 @@ def serve(
             port=port,
             reload=reload,
             log_level="info",
+            # Keep idle progress sockets alive with WebSocket ping frames
+            ws_ping_interval=30.0,
+            ws_ping_timeout=10.0,
         )
     except ImportError:
         console.print("[red]Error:[/red] uvicorn is not installed. Install it with: pip install uvicorn[standard]")
@@ -11,7 +11,11 @@ const api = axios.create({
 // Scans API
 export const scansApi = {
   list: async (page = 1, pageSize = 20, status?: string): Promise<PaginatedResponse<Scan>> => {
-    const params = new URLSearchParams({ page: String(page), page_size: String(pageSize) })
+    const params = new URLSearchParams({
+      page: String(page),
+      page_size: String(pageSize),
+      include_total: 'true',
+    })
     if (status) params.append('status', status)
     const { data } = await api.get(`/scans?${params}`)
     return data
@@ -1,4 +1,5 @@
 """Unit tests for validation cache."""
+import asyncio
 import pytest
 import json
 import hashlib
@@ -76,3 +77,102 @@ def test_cache_clear(temp_dir: Path):
     # Clear and verify
     cache.clear()
     assert cache.get("test-key") is None
+
+
+@pytest.mark.unit
+def test_cache_persists_across_instances(temp_dir: Path):
+    """Test entries written by one cache are read by the next."""
+    cache_dir = temp_dir / "cache"
+    cache = ValidationCache(cache_dir)
+    cache.set("persisted", {"verdict": "False Positive"})
+    cache.close()
+
+    reopened = ValidationCache(cache_dir)
+    assert reopened.get("persisted") == {"verdict": "False Positive"}
+
+
+@pytest.mark.unit
+def test_cache_evicts_oldest_entries(temp_dir: Path):
+    """Test cleanup keeps only the newest max_entries entries."""
+    cache = ValidationCache(temp_dir / "cache", max_entries=3, auto_cleanup_interval=5)
+
+    for i in range(5):
+        cache.set(f"key-{i}", {"index": i})
+
+    assert len(cache) == 3
+    assert cache.get("key-0") is None
+    assert cache.get("key-4") == {"index": 4}
+
+
+@pytest.mark.unit
+def test_cache_imports_json_file(temp_dir: Path):
+    """Test entries from the old JSON cache file are carried over."""
+    cache_dir = temp_dir / "cache"
+    cache_dir.mkdir()
+    json_file = cache_dir / "validation_cache.json"
+    json_file.write_text(json.dumps({"old-key": {"verdict": "True Positive"}}))
+
+    cache = ValidationCache(cache_dir)
+
+    assert cache.get("old-key") == {"verdict": "True Positive"}
+    assert not json_file.exists()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("payload", ["[]", "null"])
+def test_cache_skips_json_file_without_object(temp_dir: Path, payload: str):
+    """Test an old JSON cache whose root is not an object is discarded."""
+    cache_dir = temp_dir / "cache"
+    cache_dir.mkdir()
+    json_file = cache_dir / "validation_cache.json"
+    json_file.write_text(payload)
+
+    cache = ValidationCache(cache_dir)
+
+    assert len(cache) == 0
+    assert not json_file.exists()
+
+
+@pytest.mark.unit
+async def test_cache_async_writes_are_batched(temp_dir: Path):
+    """Test aset() results are readable at once and stored on flush."""
+    cache_dir = temp_dir / "cache"
+    cache = ValidationCache(cache_dir, flush_interval_s=60)
+
+    await cache.aset("a", {"verdict": "True Positive"})
+    await cache.aset("b", {"verdict": "False Positive"})
+    assert await cache.aget("a") == {"verdict": "True Positive"}
+    assert len(cache) == 0
+
+    await cache.aclose()
+
+    reopened = ValidationCache(cache_dir)
+    assert reopened.get("b") == {"verdict": "False Positive"}
+    assert len(reopened) == 2
+
+
+@pytest.mark.unit
+async def test_cache_clear_drops_queued_writes(temp_dir: Path):
+    """Test clear() discards aset() writes that have not been flushed yet."""
+    cache = ValidationCache(temp_dir / "cache", flush_interval_s=0.01)
+
+    await cache.aset("k", {"verdict": "True Positive"})
+    cache.clear()
+    await asyncio.sleep(0.05)
+
+    assert await cache.aget("k") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+def test_cache_hot_tier_is_bounded(temp_dir: Path):
+    """Test the in-memory tier keeps only the most recently used results."""
+    cache = ValidationCache(temp_dir / "cache", hot_entries=2)
+
+    cache.set("a", {"n": 1})
+    cache.set("b", {"n": 2})
+    cache.get("a")
+    cache.set("c", {"n": 3})
+
+    assert list(cache._hot) == ["a", "c"]
+    assert cache.get("b") == {"n": 2}
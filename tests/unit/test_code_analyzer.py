@@ -0,0 +1,45 @@
+"""Unit tests for code analyzer pattern scanning."""
+from pathlib import Path
+
+import pytest
+
+from semgrepai.analyzers.code_analyzer import CodeAnalyzer, CodeContext
+
+
+def _scan(temp_dir: Path, name: str, source: str) -> CodeContext:
+    """Write a source file and run the security pattern scan over it."""
+    file_path = temp_dir / name
+    file_path.write_text(source)
+    analyzer = CodeAnalyzer(temp_dir)
+    context = CodeContext(file_path=file_path, code_snippet="", line_number=1)
+    analyzer._find_security_patterns(context)
+    return context
+
+
+@pytest.mark.unit
+def test_sanitization_patterns_precompiled(temp_dir: Path):
+    """Test every language gets a compiled sanitization regex."""
+    analyzer = CodeAnalyzer(temp_dir)
+    assert set(analyzer._sanitization_res) == set(analyzer.sanitization_patterns)
+
+
+@pytest.mark.unit
+def test_sanitization_hits(temp_dir: Path):
+    """Test sanitizer calls are reported with their pattern and line."""
+    source = "import html\n\nvalue = html.escape(name)\nother = sanitize(value)\n"
+    context = _scan(temp_dir, "app.py", source)
+
+    assert context.sanitization_functions == [
+        {"pattern": r"html\.escape", "line": 3, "content": "value = html.escape(name)"},
+        {"pattern": r"sanitize\(", "line": 4, "content": "other = sanitize(value)"},
+    ]
+
+
+@pytest.mark.unit
+def test_no_candidates(temp_dir: Path):
+    """Test a file without any pattern literal yields no hits."""
+    context = _scan(temp_dir, "plain.py", "x = 1\ny = x + 2\n")
+
+    assert context.user_input_sources == []
+    assert context.dangerous_sinks == []
+    assert context.sanitization_functions == []
@@ -0,0 +1,132 @@
+"""Unit tests for async progress tracking."""
+import asyncio
+
+import pytest
+
+from semgrepai.async_utils.progress import AsyncProgressTracker, ProgressStatus
+
+
+@pytest.mark.unit
+async def test_updates_are_coalesced():
+    """Test a burst of updates reaches callbacks as one notification."""
+    seen = []
+
+    async def callback(update):
+        seen.append((update.processed, update.status))
+
+    tracker = AsyncProgressTracker(total=50, min_interval_s=0.05)
+    tracker.add_callback(callback)
+
+    await tracker.start()
+    for _ in range(50):
+        await tracker.update(increment=1)
+    await asyncio.sleep(0.1)
+    await tracker.complete()
+
+    assert seen == [
+        (0, ProgressStatus.RUNNING),
+        (50, ProgressStatus.RUNNING),
+        (50, ProgressStatus.COMPLETED),
+    ]
+
+
+@pytest.mark.unit
+async def test_final_state_delivered_immediately():
+    """Test completion is not held back by the flush interval."""
+    seen = []
+
+    async def callback(update):
+        seen.append(update.status)
+
+    tracker = AsyncProgressTracker(total=1, min_interval_s=60)
+    tracker.add_callback(callback)
+
+    await tracker.start()
+    await tracker.update(increment=1)
+    await asyncio.wait_for(tracker.fail("boom"), timeout=1)
+
+    assert seen == [ProgressStatus.RUNNING, ProgressStatus.FAILED]
+
+
+@pytest.mark.unit
+async def test_no_coalescing_with_zero_interval():
+    """Test every change is delivered when the interval is zero."""
+    processed = []
+
+    async def callback(update):
+        processed.append(update.processed)
+
+    tracker = AsyncProgressTracker(total=3, min_interval_s=0)
+    tracker.add_callback(callback)
+
+    await tracker.start()
+    await tracker.update(increment=1)
+    await tracker.update(increment=1)
+    await tracker.complete()
+
+    assert processed == [0, 1, 2, 3]
+
+
+@pytest.mark.unit
+async def test_failing_callback_does_not_block_others():
+    """Test a callback error is swallowed and the other callbacks still run."""
+    seen = []
+
+    async def broken(update):
+        raise RuntimeError("boom")
+
+    async def callback(update):
+        seen.append(update.status)
+
+    tracker = AsyncProgressTracker(total=1, min_interval_s=0)
+    tracker.add_callback(broken)
+    tracker.add_callback(callback)
+
+    await tracker.start()
+    await tracker.complete()
+
+    assert seen == [ProgressStatus.RUNNING, ProgressStatus.COMPLETED]
+
+
+@pytest.mark.unit
+async def test_final_state_delivered_after_slow_callback():
+    """Test completion during a slow callback is still delivered."""
+    seen = []
+
+    async def callback(update):
+        seen.append((update.processed, update.status))
+        await asyncio.sleep(0.05)
+
+    tracker = AsyncProgressTracker(total=1, min_interval_s=0.01)
+    tracker.add_callback(callback)
+
+    await tracker.start()
+    await tracker.update(increment=1)
+    await asyncio.sleep(0.02)
+    await asyncio.wait_for(tracker.complete(), timeout=1)
+
+    assert seen == [
+        (0, ProgressStatus.RUNNING),
+        (1, ProgressStatus.RUNNING),
+        (1, ProgressStatus.COMPLETED),
+    ]
+
+
+@pytest.mark.unit
+async def test_flush_task_stops_when_owner_cancelled():
+    """Test the flush task is cancelled along with the task that started it."""
+    tracker = AsyncProgressTracker(total=1, min_interval_s=60)
+    started = asyncio.Event()
+
+    async def run():
+        await tracker.start()
+        started.set()
+        await asyncio.sleep(60)
+
+    owner = asyncio.create_task(run())
+    await started.wait()
+    owner.cancel()
+    await asyncio.gather(owner, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert tracker._flush_task.cancelled()
@@ -0,0 +1,69 @@
+"""Unit tests for async rate limiting and retries."""
+import pytest
+
+from semgrepai.async_utils.rate_limiter import (
+    AsyncRateLimiter,
+    MaxRetriesExceeded,
+    RateLimitConfig,
+    with_rate_limit,
+)
+
+
+def _limiter(max_retries: int = 3) -> AsyncRateLimiter:
+    """Create a limiter that retries immediately."""
+    return AsyncRateLimiter(RateLimitConfig(
+        max_retries=max_retries,
+        requests_per_minute=6000,
+        base_delay=0,
+        jitter=False,
+    ))
+
+
+@pytest.mark.unit
+async def test_retry_runs_a_fresh_attempt():
+    """Test a transient failure is retried until it succeeds."""
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise ConnectionError("transient")
+        return "ok"
+
+    limiter = _limiter()
+    assert await limiter.execute_with_retry(flaky) == "ok"
+    assert len(attempts) == 3
+    assert limiter.request_count == 3
+
+
+@pytest.mark.unit
+async def test_retry_gives_up_with_last_error():
+    """Test exhausting retries raises MaxRetriesExceeded from the last error."""
+    limiter = _limiter(max_retries=2)
+
+    @with_rate_limit(limiter)
+    async def always_fails():
+        raise TimeoutError("slow")
+
+    with pytest.raises(MaxRetriesExceeded) as exc_info:
+        await always_fails()
+    assert isinstance(exc_info.value.__cause__, TimeoutError)
+    assert limiter.request_count == 2
+
+
+@pytest.mark.unit
+async def test_available_slots_tracks_in_flight_requests():
+    """Test slots are taken while a request runs and returned afterwards."""
+    limiter = AsyncRateLimiter(RateLimitConfig(max_concurrent=2, requests_per_minute=6000))
+    seen = []
+
+    async def call():
+        seen.append(limiter.available_slots)
+        return "ok"
+
+    assert limiter.available_slots == 2
+    async with limiter:
+        assert limiter.available_slots == 1
+        await limiter.execute_with_retry(call)
+    assert seen == [0]
+    assert limiter.available_slots == 2
@@ -0,0 +1,40 @@
+"""Unit tests for scan API routes."""
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from semgrepai.api.db.session import Base
+from semgrepai.api.models import Finding, Scan
+from semgrepai.api.routes.scans import get_scan
+
+
+@pytest.mark.unit
+async def test_get_scan_maps_semgrep_severities():
+    """Test Semgrep's ERROR/WARNING findings count as high/medium severity."""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(engine, expire_on_commit=False)() as db:
+        scan = Scan(target_path="/tmp")
+        db.add(scan)
+        await db.flush()
+        findings = [
+            {"severity": "ERROR", "ai_validation": {"verdict": "True Positive"}},
+            {"severity": "ERROR", "ai_validation": {"verdict": "False Positive"}},
+            {"severity": "WARNING", "ai_validation": {"verdict": "Needs Review"}},
+            {"severity": "INFO"},
+            {"severity": "CRITICAL"},
+        ]
+        await db.execute(insert(Finding.__table__), Finding.rows_from_scan(scan.id, findings))
+        await db.commit()
+
+        detail = await get_scan(scan.id, db=db)
+
+    await engine.dispose()
+
+    assert detail.severity_critical == 1
+    assert detail.severity_high == 2
+    assert detail.severity_medium == 1
+    assert detail.severity_low == 0
+    assert (detail.true_positives, detail.false_positives, detail.needs_review) == (1, 1, 1)